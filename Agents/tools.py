@@ -1,57 +1,390 @@
+import asyncio
+import hashlib
 import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+import aiohttp
+import httpx
+import orjson
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
-from urllib.parse import urlparse, quote
-import xml.etree.ElementTree as ET
-import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional
+from urllib.parse import quote, urlencode
+from lxml import etree
+from yarl import URL
+from collections import Counter
+from functools import lru_cache
 
 # LangChain tools
 from langchain.tools import tool
-from langchain_community.document_loaders import PyPDFLoader, WebBaseLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 
-# Data analysis
-import pandas as pd
-import numpy as np
-from collections import Counter
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
+# NLTK, scikit-learn and friends are imported inside the tools that use them,
+# so importing this module (e.g. just for the ArXiv search) stays cheap
+
+
+@lru_cache(maxsize=1)
+def _ensure_nltk_data():
+    """Download the NLTK corpora the text tools need, probing the filesystem only once per process."""
+    import nltk
+
+    for resource, package in (('tokenizers/punkt', 'punkt'),
+                              ('corpora/stopwords', 'stopwords'),
+                              ('corpora/wordnet', 'wordnet')):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+
+# Shared HTTP session: keep-alive connections across tool calls, gzip bodies,
+# and exponential backoff on rate limits (429) and transient 5xx responses
+_USER_AGENT = 'algorand-byop/1.0 (+https://github.com/Sayyam-Karnavat/algorand_BYOP)'
+_HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': _USER_AGENT, 'Accept-Encoding': 'gzip'})
+_retries = Retry(total=3, backoff_factor=0.5, backoff_jitter=0.5, status_forcelist=(429, 500, 502, 503, 504))
+for _scheme in ('http://', 'https://'):
+    _SESSION.mount(_scheme, HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_retries))
+
+
+# Exact-match response cache shared by the ArXiv and Semantic Scholar tools, so an agent
+# repeating a query within RESPONSE_CACHE_TTL seconds gets a local read instead of a round-trip
+RESPONSE_CACHE_DB = "tool_cache.db"
+RESPONSE_CACHE_TTL = 6 * 3600
+_cache_db = None
+_cache_lock = threading.Lock()
+
+
+def _response_cache():
+    global _cache_db
+    if _cache_db is None:
+        _cache_db = sqlite3.connect(RESPONSE_CACHE_DB, check_same_thread=False)
+        _cache_db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts REAL)")
+    return _cache_db
+
+
+def _cache_key(tool_name: str, args: Dict[str, Any]) -> str:
+    """Canonicalize the arguments (sorted JSON, collapsed whitespace) and hash them, namespaced by tool."""
+    normalized = {k: ' '.join(v.split()) if isinstance(v, str) else v for k, v in args.items()}
+    payload = orjson.dumps([tool_name, normalized], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _cache_get(key: str, ttl: float = RESPONSE_CACHE_TTL) -> Optional[Any]:
+    with _cache_lock:
+        row = _response_cache().execute(
+            "SELECT value FROM cache WHERE key = ? AND ts > ?", (key, time.time() - ttl)
+        ).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def _cache_put(key: str, value: Any) -> None:
+    with _cache_lock:
+        with _response_cache() as db:
+            db.execute("INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                       (key, orjson.dumps(value), time.time()))
+
+
+# Namespace-qualified Atom tags, built once rather than per entry
+_NS = {'atom': 'http://www.w3.org/2005/Atom'}
+(_ATOM_ENTRY, _ATOM_ID, _ATOM_TITLE, _ATOM_SUMMARY, _ATOM_AUTHOR, _ATOM_NAME,
+ _ATOM_PUBLISHED, _ATOM_UPDATED, _ATOM_CATEGORY, _ATOM_LINK) = [
+    f"{{{_NS['atom']}}}{name}"
+    for name in ('entry', 'id', 'title', 'summary', 'author', 'name',
+                 'published', 'updated', 'category', 'link')
+]
+
+
+def _iso_to_epoch(text: Optional[str]) -> Optional[int]:
+    """ArXiv timestamps are UTC ISO 8601 ('2024-01-31T18:00:00Z'); return them as epoch seconds."""
+    if not text:
+        return None
+    parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        # Bare dates (e.g. Semantic Scholar's publicationDate) are UTC too
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _parse_arxiv_entry(entry) -> Dict[str, Any]:
+    """Convert one Atom <entry> element into a paper dict in a single pass over its children."""
+    paper = {
+        'id': None,
+        'title': '',
+        'summary': '',
+        'authors': [],
+        'published': None,
+        'updated': None,
+        # Numeric copies of published/updated, so filters and sorts compare ints instead of re-parsing
+        'published_ts': None,
+        'updated_ts': None,
+        'categories': [],
+        'pdf_url': None
+    }
+    for child in entry:
+        tag = child.tag
+        if tag == _ATOM_ID:
+            paper['id'] = child.text
+        elif tag == _ATOM_TITLE:
+            paper['title'] = (child.text or '').strip()
+        elif tag == _ATOM_SUMMARY:
+            paper['summary'] = (child.text or '').strip()
+        elif tag == _ATOM_PUBLISHED:
+            paper['published'] = child.text
+            paper['published_ts'] = _iso_to_epoch(child.text)
+        elif tag == _ATOM_UPDATED:
+            paper['updated'] = child.text
+            paper['updated_ts'] = _iso_to_epoch(child.text)
+        elif tag == _ATOM_AUTHOR:
+            name = child.findtext(_ATOM_NAME)
+            if name is not None:
+                paper['authors'].append(name)
+        elif tag == _ATOM_CATEGORY:
+            paper['categories'].append(child.get('term'))
+        elif tag == _ATOM_LINK and paper['pdf_url'] is None and child.get('title') == 'pdf':
+            paper['pdf_url'] = child.get('href')
+    return paper
+
+
+async def _aiter_arxiv_entries(content):
+    """Feed an aiohttp body through a pull parser, yielding paper dicts as each entry closes."""
+    parser = etree.XMLPullParser(events=('end',), tag=_ATOM_ENTRY)
+    # iter_any hands over each buffer as the transport receives it (already gunzipped), so
+    # parsing keeps pace with the download instead of waiting on fixed-size chunks
+    async for chunk in content.iter_any():
+        parser.feed(chunk)
+        for _, entry in parser.read_events():
+            yield _parse_arxiv_entry(entry)
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+    parser.close()
+
+
+def _build_arxiv_params(query: str, max_results: int, sort_by: str,
+                        category: str, start_date: str, end_date: str) -> Dict[str, Any]:
+    """Build the ArXiv API query parameters for one search."""
+    search_query = query
+    if category:
+        search_query = f"cat:{category} AND ({query})"
+    
+    # Date filtering
+    if start_date and end_date:
+        search_query += f" AND submittedDate:[{start_date}* TO {end_date}*]"
+    elif start_date:
+        search_query += f" AND submittedDate:[{start_date}* TO *]"
+    elif end_date:
+        search_query += f" AND submittedDate:[* TO {end_date}*]"
+    
+    return {
+        'search_query': search_query,
+        'start': 0,
+        'max_results': max_results,
+        'sortBy': sort_by,
+        'sortOrder': 'descending'
+    }
+
+
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+
+@lru_cache(maxsize=256)
+def _arxiv_url(search_query: str, start: int, max_results: int, sortBy: str, sortOrder: str) -> URL:
+    """Encode an ArXiv query URL once per distinct parameter set; encoded=True stops aiohttp re-quoting it."""
+    query = urlencode({'search_query': search_query, 'start': start, 'max_results': max_results,
+                       'sortBy': sortBy, 'sortOrder': sortOrder}, quote_via=quote)
+    return URL(f"{ARXIV_API_URL}?{query}", encoded=True)
+
+
+class _RateLimiter:
+    """Space requests to one API at least `interval` seconds apart, across threads and event loops."""
 
-# NLP
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.stem import WordNetLemmatizer
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
 
-# Web scraping
-from bs4 import BeautifulSoup
+    def reserve(self) -> float:
+        """Claim the next request slot and return how many seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        return slot - now
 
+    def wait(self) -> None:
+        time.sleep(self.reserve())
 
+    def back_off(self, seconds: float) -> None:
+        """Hold every caller off for `seconds`, e.g. after a 429."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# ArXiv's API guidance is one request every 3 seconds per client; unauthenticated
+# Semantic Scholar allows about one per second. Both limits are shared by every tool call
+ARXIV_REQUEST_INTERVAL = 3.0
+SEMANTIC_SCHOLAR_REQUEST_INTERVAL = 1.0
+_ARXIV_LIMITER = _RateLimiter(ARXIV_REQUEST_INTERVAL)
+_SEMANTIC_SCHOLAR_LIMITER = _RateLimiter(SEMANTIC_SCHOLAR_REQUEST_INTERVAL)
 
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet')
+# Throttled (429) or briefly unavailable (5xx) queries are retried with jittered exponential
+# backoff, honouring Retry-After when ArXiv sends one
+ARXIV_RETRIES = 3
+ARXIV_BACKOFF = 1.0
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+async def _fetch_arxiv(session: aiohttp.ClientSession, params: Dict[str, Any],
+                       no_cache: bool = False) -> List[Dict[str, Any]]:
+    """Run one ArXiv query under the shared rate limit and parse the feed."""
+    key = _cache_key('search_arxiv', params)
+    if not no_cache and (papers := _cache_get(key)) is not None:
+        return papers
+
+    for attempt in range(ARXIV_RETRIES + 1):
+        await asyncio.sleep(_ARXIV_LIMITER.reserve())
+        async with session.get(_arxiv_url(**params)) as response:
+            if response.status in _RETRY_STATUSES and attempt < ARXIV_RETRIES:
+                retry_after = response.headers.get('Retry-After', '')
+                delay = float(retry_after) if retry_after.isdigit() else ARXIV_BACKOFF * 2 ** attempt
+                _ARXIV_LIMITER.back_off(delay + random.uniform(0, ARXIV_BACKOFF))
+                continue
+            response.raise_for_status()
+            # Parse as the body arrives; the full feed is never buffered or built into one tree
+            papers = [paper async for paper in _aiter_arxiv_entries(response.content)]
+            break
+    _cache_put(key, papers)
+    return papers
+
+
+# Large searches are fetched as successive pages via `start`, since single responses past a
+# couple hundred entries get slow or stall; ARXIV_MAX_RESULTS caps any one search
+ARXIV_PAGE_SIZE = 100
+ARXIV_MAX_RESULTS = 1000
+
+
+async def _search_arxiv_paged(session: aiohttp.ClientSession, params: Dict[str, Any],
+                              no_cache: bool = False) -> List[Dict[str, Any]]:
+    """Fetch one search a page at a time, stopping early once ArXiv runs out of results."""
+    max_results = min(params['max_results'], ARXIV_MAX_RESULTS)
+    papers = []
+    for offset in range(params['start'], params['start'] + max_results, ARXIV_PAGE_SIZE):
+        page_size = min(ARXIV_PAGE_SIZE, params['start'] + max_results - offset)
+        page = await _fetch_arxiv(session, {**params, 'start': offset, 'max_results': page_size}, no_cache)
+        papers.extend(page)
+        if len(page) < page_size:
+            break
+    return papers
+
+
+async def search_arxiv_advanced_async(query: str, max_results: int = 10, sort_by: str = "relevance",
+                                      category: str = "", start_date: str = "", end_date: str = "",
+                                      no_cache: bool = False) -> List[Dict[str, Any]]:
+    """
+    Async twin of search_arxiv_advanced.
+    
+    Returns:
+        List of paper dicts
+    """
+    papers, = await search_arxiv_many_async([{
+        'query': query, 'max_results': max_results, 'sort_by': sort_by,
+        'category': category, 'start_date': start_date, 'end_date': end_date
+    }], no_cache=no_cache)
+    return papers
+
+
+async def search_arxiv_many_async(searches: List[Dict[str, Any]],
+                                  no_cache: bool = False) -> List[List[Dict[str, Any]]]:
+    """
+    Run several ArXiv searches over one session, e.g. one per category or date slice.
+    Requests start as the shared rate limit allows; their downloads and parsing overlap.
+    
+    Args:
+        searches: List of keyword dicts accepted by search_arxiv_advanced
+        no_cache: Bypass cached responses and always query ArXiv
+    
+    Returns:
+        One list of paper dicts per search, in the same order
+    """
+    defaults = {'max_results': 10, 'sort_by': "relevance", 'category': "", 'start_date': "", 'end_date': ""}
+    timeout = aiohttp.ClientTimeout(total=_HTTP_TIMEOUT[1], connect=_HTTP_TIMEOUT[0])
+    # One event loop and one pooled connector per tool call; the host is resolved once
+    connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': _USER_AGENT},
+                                     timeout=timeout) as session:
+        return await asyncio.gather(*(
+            _search_arxiv_paged(session, _build_arxiv_params(**{**defaults, **search}), no_cache)
+            for search in searches
+        ))
+
+
+SEMANTIC_SCHOLAR_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
+SEMANTIC_SCHOLAR_SEARCH_LIMIT = 100  # Most results the search endpoint returns per request
+_SEARCH_FIELDS = 'title,authors,abstract,externalIds,year,publicationDate,openAccessPdf'
+
+
+def _search_semantic_scholar(query: str, max_results: int, no_cache: bool = False) -> List[Dict[str, Any]]:
+    """
+    Relevance search through Semantic Scholar's compact JSON API, mapped onto the ArXiv paper schema.
+    Fields ArXiv-only metadata would fill (updated, categories) are left empty.
+    """
+    params = {'query': query, 'limit': min(max_results, SEMANTIC_SCHOLAR_SEARCH_LIMIT), 'fields': _SEARCH_FIELDS}
+    key = _cache_key('search_semantic_scholar', params)
+    if not no_cache and (papers := _cache_get(key)) is not None:
+        return papers
+
+    _SEMANTIC_SCHOLAR_LIMITER.wait()
+    response = _SESSION.get(SEMANTIC_SCHOLAR_SEARCH_URL, params=params, timeout=_HTTP_TIMEOUT)
+    response.raise_for_status()
+
+    papers = []
+    for record in orjson.loads(response.content).get('data', []):
+        arxiv_id = (record.get('externalIds') or {}).get('ArXiv')
+        published = record.get('publicationDate') or (str(record['year']) if record.get('year') else None)
+        pdf = record.get('openAccessPdf') or {}
+        papers.append({
+            'id': f"http://arxiv.org/abs/{arxiv_id}" if arxiv_id else record.get('paperId'),
+            'title': (record.get('title') or '').strip(),
+            'summary': (record.get('abstract') or '').strip(),
+            'authors': [author.get('name', '') for author in record.get('authors', [])],
+            'published': published,
+            'updated': None,
+            'published_ts': _iso_to_epoch(record.get('publicationDate')),
+            'updated_ts': None,
+            'categories': [],
+            'pdf_url': pdf.get('url') or (f"http://arxiv.org/pdf/{arxiv_id}" if arxiv_id else None)
+        })
+    _cache_put(key, papers)
+    return papers
+
+
+async def _search_arxiv_advanced_impl(query: str, max_results: int = 10, sort_by: str = "relevance",
+                                      category: str = "", start_date: str = "", end_date: str = "",
+                                      backend: str = "arxiv") -> List[Dict[str, Any]]:
+    """
+    search_arxiv_advanced without the JSON encoding, for in-process async callers that want the paper dicts.
+    The @tool only runs it to completion and serializes for LLM-facing use.
+    """
+    if backend == "semantic_scholar" and not (category or start_date or end_date) and sort_by == "relevance":
+        return await asyncio.to_thread(_search_semantic_scholar, query, max_results)
+    
+    return await search_arxiv_advanced_async(
+        query, max_results=max_results, sort_by=sort_by,
+        category=category, start_date=start_date, end_date=end_date
+    )
 
 
 # ======================= ARXIV TOOLS =======================
 
 @tool
 def search_arxiv_advanced(query: str, max_results: int = 10, sort_by: str = "relevance", 
-                         category: str = "", start_date: str = "", end_date: str = "") -> str:
+                         category: str = "", start_date: str = "", end_date: str = "",
+                         backend: str = "arxiv") -> str:
     """
     Advanced ArXiv search with filtering options.
     
@@ -62,67 +395,164 @@ def search_arxiv_advanced(query: str, max_results: int = 10, sort_by: str = "rel
         category: ArXiv category filter (e.g., 'cs.AI', 'stat.ML')
         start_date: Start date filter (YYYY-MM-DD format)
         end_date: End date filter (YYYY-MM-DD format)
+        backend: 'arxiv' (default) or 'semantic_scholar' for a faster JSON search; falls back to
+            ArXiv when category, date filters or a non-relevance sort are requested
     
     Returns:
         JSON string with paper details
     """
     try:
-        # Build query
-        search_query = query
-        if category:
-            search_query = f"cat:{category} AND ({query})"
-        
-        # Date filtering
-        if start_date or end_date:
-            date_filter = []
-            if start_date:
-                date_filter.append(f"submittedDate:[{start_date}*")
-            if end_date:
-                date_filter.append(f"TO {end_date}*]")
-            if len(date_filter) == 2:
-                search_query += f" AND submittedDate:[{start_date}* TO {end_date}*]"
-            elif start_date:
-                search_query += f" AND submittedDate:[{start_date}* TO *]"
-            elif end_date:
-                search_query += f" AND submittedDate:[* TO {end_date}*]"
-        
-        # ArXiv API call
-        base_url = "http://export.arxiv.org/api/query"
-        params = {
-            'search_query': search_query,
-            'start': 0,
-            'max_results': max_results,
-            'sortBy': sort_by,
-            'sortOrder': 'descending'
-        }
-        
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
-        
-        # Parse XML response
-        root = ET.fromstring(response.content)
-        papers = []
-        
-        for entry in root.findall('{http://www.w3.org/2005/Atom}entry'):
-            paper = {
-                'id': entry.find('{http://www.w3.org/2005/Atom}id').text,
-                'title': entry.find('{http://www.w3.org/2005/Atom}title').text.strip(),
-                'summary': entry.find('{http://www.w3.org/2005/Atom}summary').text.strip(),
-                'authors': [author.find('{http://www.w3.org/2005/Atom}name').text 
-                           for author in entry.findall('{http://www.w3.org/2005/Atom}author')],
-                'published': entry.find('{http://www.w3.org/2005/Atom}published').text,
-                'updated': entry.find('{http://www.w3.org/2005/Atom}updated').text,
-                'categories': [cat.get('term') for cat in entry.findall('{http://www.w3.org/2005/Atom}category')],
-                'pdf_url': next((link.get('href') for link in entry.findall('{http://www.w3.org/2005/Atom}link') 
-                               if link.get('title') == 'pdf'), None)
-            }
-            papers.append(paper)
-        
-        return json.dumps(papers, indent=2)
+        papers = asyncio.run(_search_arxiv_advanced_impl(
+            query, max_results, sort_by, category, start_date, end_date, backend
+        ))
+        return orjson.dumps(papers, option=orjson.OPT_INDENT_2).decode()
         
     except Exception as e:
         return f"Error searching ArXiv: {str(e)}"
     
+SEMANTIC_SCHOLAR_BATCH_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500  # Most IDs the batch endpoint accepts per request
+_CITATION_FIELDS = 'title,authors,citationCount,citations.title,citations.authors,references.title,references.authors,year,venue'
+
+
+# Bare ArXiv ID out of a URL, an 'arXiv:' reference or a plain ID, minus any version suffix
+_ARXIV_ID_RE = re.compile(r'(?:https?://\S+/)?(?:arXiv:)?(?P<id>[\w./-]+?)(?:v\d+)?(?:\.pdf)?$')
+
+
+def _clean_arxiv_id(arxiv_id: str) -> str:
+    arxiv_id = arxiv_id.strip()
+    match = _ARXIV_ID_RE.match(arxiv_id)
+    return match.group('id') if match else arxiv_id
+
+
+def _format_citations(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Semantic Scholar paper record to the citation summary the tools return."""
+    return {
+        'title': data.get('title', ''),
+        'citation_count': data.get('citationCount', 0),
+        'year': data.get('year', ''),
+        'venue': data.get('venue', ''),
+        'top_citations': [
+            {
+                'title': cite.get('title', ''),
+                'authors': [author.get('name', '') for author in cite.get('authors', [])]
+            }
+            for cite in data.get('citations', [])[:5]
+        ],
+        'top_references': [
+            {
+                'title': ref.get('title', ''),
+                'authors': [author.get('name', '') for author in ref.get('authors', [])]
+            }
+            for ref in data.get('references', [])[:5]
+        ]
+    }
+
+
+SEMANTIC_SCHOLAR_RETRIES = 3
+SEMANTIC_SCHOLAR_BACKOFF = 0.5
+
+
+async def _apost_citation_batch(client: httpx.AsyncClient, arxiv_ids: List[str]) -> Optional[List[Any]]:
+    """POST one batch lookup, retrying throttled or failed requests; None if it never succeeds."""
+    for attempt in range(SEMANTIC_SCHOLAR_RETRIES + 1):
+        await asyncio.sleep(_SEMANTIC_SCHOLAR_LIMITER.reserve())
+        response = await client.post(
+            SEMANTIC_SCHOLAR_BATCH_URL,
+            params={'fields': _CITATION_FIELDS},
+            json={'ids': [f"ARXIV:{arxiv_id}" for arxiv_id in arxiv_ids]}
+        )
+        if response.status_code in _RETRY_STATUSES and attempt < SEMANTIC_SCHOLAR_RETRIES:
+            _SEMANTIC_SCHOLAR_LIMITER.back_off(SEMANTIC_SCHOLAR_BACKOFF * 2 ** attempt
+                                               + random.uniform(0, SEMANTIC_SCHOLAR_BACKOFF))
+            continue
+        return orjson.loads(response.content) if response.status_code == 200 else None
+    return None
+
+
+async def _apost_citation_batches(batches: List[List[str]]) -> List[Optional[List[Any]]]:
+    """Send every batch over one HTTP/2 connection, so responses multiplex instead of queueing."""
+    limits = httpx.Limits(max_connections=8)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=_HTTP_TIMEOUT[1],
+                                 headers={'User-Agent': _USER_AGENT}) as client:
+        return await asyncio.gather(*(_apost_citation_batch(client, batch) for batch in batches))
+
+
+async def _afetch_citation_records(arxiv_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Look up Semantic Scholar records for cleaned ArXiv IDs, one POST per 500 uncached IDs.
+    Returns records aligned with arxiv_ids; None where the paper is unknown.
+    """
+    keys = [_cache_key('get_paper_citations', {'arxiv_id': arxiv_id}) for arxiv_id in arxiv_ids]
+    records = [_cache_get(key) for key in keys]
+    missing = [i for i, record in enumerate(records) if record is None]
+    if not missing:
+        return records
+
+    chunks = [missing[start:start + SEMANTIC_SCHOLAR_BATCH_SIZE]
+              for start in range(0, len(missing), SEMANTIC_SCHOLAR_BATCH_SIZE)]
+    responses = await _apost_citation_batches([[arxiv_ids[i] for i in chunk] for chunk in chunks])
+    for chunk, batch in zip(chunks, responses):
+        if batch is None:
+            continue
+        # The response list is aligned with the requested IDs, with null for unknown papers
+        for i, record in zip(chunk, batch):
+            if record is not None:
+                records[i] = record
+                _cache_put(keys[i], record)
+    return records
+
+
+async def _get_paper_citations_impl(arxiv_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Citation summaries as dicts, aligned with arxiv_ids (None where unknown), for in-process async callers;
+    the citation @tools are thin JSON wrappers that run the same lookup to completion.
+    """
+    records = await _afetch_citation_records([_clean_arxiv_id(arxiv_id) for arxiv_id in arxiv_ids])
+    return [_format_citations(data) if data is not None else None for data in records]
+
+
+@tool
+def get_paper_citations_bulk(arxiv_ids: List[str]) -> str:
+    """
+    Get citation counts and related papers for several ArXiv papers in one Semantic Scholar request.
+    
+    Args:
+        arxiv_ids: ArXiv paper IDs (e.g., ['2012.12345', '2101.00001'])
+    
+    Returns:
+        JSON string with one entry per ID, in order; null where no data was found
+    """
+    try:
+        citations = asyncio.run(_get_paper_citations_impl(arxiv_ids))
+        return orjson.dumps(citations, option=orjson.OPT_INDENT_2).decode()
+    
+    except Exception as e:
+        return f"Error retrieving citation data: {str(e)}"
+
+
+class _CitationsNotFound(LookupError):
+    pass
+
+
+@lru_cache(maxsize=1024)
+def _paper_citations_json(arxiv_id: str, ttl_window: int) -> str:
+    """
+    get_paper_citations' in-process memo in front of the SQLite cache for repeat lookups of one paper.
+    ttl_window is the current RESPONSE_CACHE_TTL period, so entries stop matching once it rolls over.
+    Raises _CitationsNotFound when there is no data, so misses are never memoized.
+    """
+    citations, = asyncio.run(_get_paper_citations_impl([arxiv_id]))
+    if citations is None:
+        raise _CitationsNotFound(arxiv_id)
+    return orjson.dumps(citations, option=orjson.OPT_INDENT_2).decode()
+
+
+def clear_citation_cache() -> None:
+    """Forget the in-process citation memo (the SQLite cache is left alone)."""
+    _paper_citations_json.cache_clear()
+
+
 @tool
 def get_paper_citations(arxiv_id: str) -> str:
     """
@@ -135,48 +565,11 @@ def get_paper_citations(arxiv_id: str) -> str:
         JSON string with citation information
     """
     try:
-        # Clean ArXiv ID
-        if arxiv_id.startswith('http'):
-            arxiv_id = arxiv_id.split('/')[-1]
-        if arxiv_id.startswith('arXiv:'):
-            arxiv_id = arxiv_id[6:]
-        
-        # Semantic Scholar API
-        url = f"https://api.semanticscholar.org/graph/v1/paper/ARXIV:{arxiv_id}"
-        params = {
-            'fields': 'title,authors,citationCount,citations.title,citations.authors,references.title,references.authors,year,venue'
-        }
+        arxiv_id = _clean_arxiv_id(arxiv_id)
+        return _paper_citations_json(arxiv_id, int(time.time() // RESPONSE_CACHE_TTL))
         
-        response = requests.get(url, params=params)
-        
-        if response.status_code == 200:
-            data = response.json()
-            
-            result = {
-                'title': data.get('title', ''),
-                'citation_count': data.get('citationCount', 0),
-                'year': data.get('year', ''),
-                'venue': data.get('venue', ''),
-                'top_citations': [
-                    {
-                        'title': cite.get('title', ''),
-                        'authors': [author.get('name', '') for author in cite.get('authors', [])]
-                    }
-                    for cite in data.get('citations', [])[:5]
-                ],
-                'top_references': [
-                    {
-                        'title': ref.get('title', ''),
-                        'authors': [author.get('name', '') for author in ref.get('authors', [])]
-                    }
-                    for ref in data.get('references', [])[:5]
-                ]
-            }
-            
-            return json.dumps(result, indent=2)
-        else:
-            return f"Could not find citation data for ArXiv ID: {arxiv_id}"
-            
+    except _CitationsNotFound:
+        return f"Could not find citation data for ArXiv ID: {arxiv_id}"
     except Exception as e:
         return f"Error retrieving citation data: {str(e)}"
     
@@ -196,6 +589,11 @@ def extract_keywords(text: str, num_keywords: int = 10, method: str = "frequency
         JSON string with extracted keywords
     """
     try:
+        from nltk.corpus import stopwords
+        from nltk.tokenize import word_tokenize, sent_tokenize
+        from nltk.stem import WordNetLemmatizer
+        _ensure_nltk_data()
+
         # Preprocess text
         words = word_tokenize(text.lower())
         stop_words = set(stopwords.words('english'))
@@ -254,6 +652,9 @@ def analyze_text_complexity(text: str) -> str:
         JSON string with complexity metrics
     """
     try:
+        from nltk.tokenize import word_tokenize, sent_tokenize
+        _ensure_nltk_data()
+
         sentences = sent_tokenize(text)
         words = word_tokenize(text)
         
@@ -5,10 +5,11 @@ This MCP server provides comprehensive tools for interacting with the Algorand b
 """
 
 import asyncio
-import json
+import functools
 import logging
+import time
 from typing import Any, Dict, List, Optional, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # MCP imports
 from mcp.server import Server
@@ -24,26 +25,190 @@ from mcp.types import (
 )
 
 # Algorand SDK imports
-from algosdk import account, mnemonic, transaction, logic
+from algosdk import account, mnemonic, transaction, logic, constants, error
 from algosdk.v2client import algod, indexer
 from algosdk.future.transaction import (
     PaymentTxn, ApplicationCreateTxn, ApplicationCallTxn, 
     AssetCreateTxn, AssetTransferTxn, AssetConfigTxn
 )
 from algosdk.account import address_from_private_key
+from algosdk import encoding
 from algosdk.encoding import decode_address, encode_address
-from algosdk.util import algos_to_microalgos, microalgos_to_algos
 
 # Additional imports
 import base64
 import hashlib
+import os
+import secrets
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import aiohttp
+import numpy as np
+import orjson
+from aiohttp import web
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from Cryptodome.Cipher import ChaCha20
+from nacl.signing import SigningKey
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("algorand-mcp-server")
 
+MICROALGOS_PER_ALGO = 1_000_000
+
+def _format_utc(timestamp: int) -> str:
+    """Format a unix timestamp as ISO-8601 UTC without building a datetime"""
+    return "%04d-%02d-%02dT%02d:%02d:%02d+00:00" % time.gmtime(timestamp)[:6]
+
+def microalgos_to_algos_batch(microalgos: List[int]) -> List[float]:
+    """Convert a batch of microAlgo amounts to Algos in one vectorized pass"""
+    return (np.asarray(microalgos, dtype=np.int64) / MICROALGOS_PER_ALGO).tolist()
+
+# Type-specific fields pulled from indexer transactions, keyed by tx-type.
+# Missing sub-objects fall back to _EMPTY instead of raising KeyError.
+_EMPTY = {}
+
+def _extract_pay(txn: dict) -> dict:
+    payment = txn.get("payment-transaction") or _EMPTY
+    return {
+        "receiver": payment.get("receiver"),
+        "amount": payment.get("amount", 0)
+    }
+
+def _extract_axfer(txn: dict) -> dict:
+    transfer = txn.get("asset-transfer-transaction") or _EMPTY
+    return {
+        "asset_id": transfer.get("asset-id"),
+        "receiver": transfer.get("receiver"),
+        "amount": transfer.get("amount", 0)
+    }
+
+def _extract_appl(txn: dict) -> dict:
+    application = txn.get("application-transaction") or _EMPTY
+    return {"application_id": application.get("application-id")}
+
+def _transaction_columns(txns: List[dict]) -> dict:
+    """Walk indexer transactions once into parallel per-field lists (struct-of-arrays)"""
+    ids, tx_types, rounds, round_times, fees, senders, receivers, amounts = ([] for _ in range(8))
+    for txn in txns:
+        tx_type = txn.get("tx-type", "unknown")
+        transfer = txn.get("payment-transaction") or txn.get("asset-transfer-transaction") or _EMPTY
+        ids.append(txn.get("id"))
+        tx_types.append(tx_type)
+        rounds.append(txn.get("confirmed-round"))
+        round_times.append(txn.get("round-time") or 0)
+        fees.append(txn.get("fee", 0))
+        senders.append(txn.get("sender"))
+        receivers.append(transfer.get("receiver"))
+        amounts.append(transfer.get("amount", 0))
+    
+    amounts_algo = microalgos_to_algos_batch(amounts)
+    return {
+        "id": ids,
+        "type": tx_types,
+        "round": rounds,
+        "round_time": round_times,
+        "fee": fees,
+        "sender": senders,
+        "receiver": receivers,
+        "amount": amounts,
+        "amount_algo": [
+            amount_algo if tx_type == "pay" else None
+            for tx_type, amount_algo in zip(tx_types, amounts_algo)
+        ]
+    }
+
+# Key derivation is pure, so repeat callers skip the ed25519/checksum work.
+# functools.lru_cache guards its own bookkeeping with a lock, so these are
+# safe to call from the worker threads used by _run_blocking as well.
+_address_from_private_key = functools.lru_cache(maxsize=4096)(address_from_private_key)
+_mnemonic_to_private_key = functools.lru_cache(maxsize=512)(mnemonic.to_private_key)
+
+SUGGESTED_PARAMS_TTL = 3.0  # seconds
+
+# Direct HTTP access to algod/indexer
+HTTP_MAX_CONCURRENCY = 64
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _http_error_message(body: bytes) -> str:
+    """Pull the node's error message out of a failed response body"""
+    try:
+        return orjson.loads(body)["message"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return body.decode("utf-8", errors="replace")
+
+def _query_params(params: dict) -> dict:
+    """Drop unset query params and render booleans the way the REST API expects"""
+    return {
+        k: ("true" if v else "false") if isinstance(v, bool) else v
+        for k, v in params.items()
+        if v is not None
+    }
+
+# Per-tool metrics
+TOOL_DURATION = Histogram(
+    "tool_duration_seconds", "Time spent handling an MCP tool call", ["tool"]
+)
+TOOL_ERRORS = Counter(
+    "tool_errors_total", "MCP tool calls that failed", ["tool", "exc_type"]
+)
+
+def _instrumented(tool: str):
+    """Record call latency for a tool handler; failures are counted by _error_response"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                TOOL_DURATION.labels(tool).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+def _text(obj) -> List[TextContent]:
+    """Serialize a tool result to an indented JSON TextContent payload.
+
+    orjson emits UTF-8 bytes; TextContent only carries str, so the bytes are
+    decoded exactly once here and never round-tripped through json/str again.
+    """
+    payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return [TextContent(type="text", text=payload.decode("utf-8"))]
+
+# Error message prefix for each tool
+_ERR = {
+    "create_account": "Error creating account: ",
+    "get_account_info": "Error getting account info: ",
+    "get_accounts_info": "Error getting accounts info: ",
+    "restore_account_from_mnemonic": "Error restoring account: ",
+    "create_accounts_batch": "Error creating accounts: ",
+    "send_payment": "Error sending payment: ",
+    "send_payment_batch": "Error sending payment batch: ",
+    "get_transaction": "Error getting transaction: ",
+    "create_asset": "Error creating asset: ",
+    "transfer_asset": "Error transferring asset: ",
+    "get_asset_info": "Error getting asset info: ",
+    "create_application": "Error creating application: ",
+    "call_application": "Error calling application: ",
+    "get_application_info": "Error getting application info: ",
+    "get_blockchain_status": "Error getting blockchain status: ",
+    "get_block_info": "Error getting block info: ",
+    "search_transactions": "Error searching transactions: ",
+    "get_account_transactions": "Error getting account transactions: "
+}
+
+def _error_response(tool: str, exc: Exception) -> List[TextContent]:
+    """Count and log a tool failure, then build its error payload"""
+    exc_type = type(exc).__name__
+    message = str(exc)
+    TOOL_ERRORS.labels(tool, exc_type).inc()
+    logger.warning(f"tool={tool} exc_type={exc_type} error={message}")
+    return [TextContent(type="text", text=_ERR[tool] + message)]
+
 @dataclass
 class AlgorandConfig:
     """Configuration for Algorand connections"""
@@ -52,6 +217,80 @@ class AlgorandConfig:
     indexer_address: str = "https://testnet-idx.algonode.cloud"
     indexer_token: str = ""
     network: str = "testnet"  # testnet, mainnet, betanet
+    # Serve Prometheus metrics on this port while the server runs; None disables it
+    metrics_port: Optional[int] = None
+    metrics_host: str = "127.0.0.1"
+
+class _OrjsonShim:
+    """Drop-in for the json module inside algosdk's HTTP clients, backed by orjson"""
+    JSONDecodeError = orjson.JSONDecodeError
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+    @staticmethod
+    def load(fp, **kwargs):
+        return orjson.loads(fp.read())
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        option = 0
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+
+# algosdk only uses json.load/loads on its request paths, so swapping the
+# module reference makes every AlgodClient/IndexerClient parse with orjson
+algod.json = _OrjsonShim
+indexer.json = _OrjsonShim
+
+# Resources never change at runtime, so build them once
+STATIC_RESOURCES = [
+    Resource(
+        uri="algorand://network/status",
+        name="Network Status",
+        description="Current Algorand network status and information",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="algorand://tools/documentation",
+        name="Tool Documentation",
+        description="Documentation for all available Algorand tools",
+        mimeType="text/markdown"
+    )
+]
+
+# Result shapes for the tools that return the largest payloads
+@dataclass(slots=True)
+class AccountInfoResult:
+    address: str
+    balance_algo: float
+    balance_microalgo: int
+    minimum_balance: float
+    round: int
+    status: str
+    assets: list
+    created_apps: list
+    apps_local_state: list
+    participation: dict
+    created_apps_count: int
+    network: str
+
+@dataclass(slots=True)
+class SearchTransactionsResult:
+    search_params: dict
+    transactions: list
+    next_token: Optional[str]
+    network: str
+
+@dataclass(slots=True)
+class BlockInfoResult:
+    round: int
+    block_info: dict
+    network: str
 
 class AlgorandMCPServer:
     """Enhanced Algorand MCP Server with comprehensive blockchain tools"""
@@ -61,6 +300,22 @@ class AlgorandMCPServer:
         self.server = Server("algorand-enhanced")
         self.algod_client = None
         self.indexer_client = None
+        # Pooled HTTP session for hot endpoints, created on first use inside the event loop
+        self._http = None
+        self._http_limiter = asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+        # (expiry, SuggestedParams) shared by every transaction-building tool
+        self._params_cache = None
+        self._params_lock = asyncio.Lock()
+        # Userspace DRBG for bulk key generation, seeded once from the OS
+        self._key_drbg = ChaCha20.new(key=secrets.token_bytes(32), nonce=secrets.token_bytes(12))
+        self._key_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._txn_extractors = {
+            "pay": _extract_pay,
+            "axfer": _extract_axfer,
+            "appl": _extract_appl
+        }
+        # Compiled TEAL keyed by blake2b(source) -> (binary, program hash)
+        self._teal_cache = {}
         self._setup_clients()
         self._register_tools()
         self._register_resources()
@@ -80,20 +335,215 @@ class AlgorandMCPServer:
                 headers={"User-Agent": "algorand-mcp-server"}
             )
             
-            # Test connections
-            self.algod_client.status()
-            logger.info(f"Connected to Algorand {self.config.network}")
+            # Connectivity surfaces on the first tool call rather than at startup
+            logger.info(f"Configured Algorand {self.config.network} clients")
             
         except Exception as e:
-            logger.error(f"Failed to connect to Algorand: {e}")
+            logger.error(f"Failed to initialize Algorand clients: {e}")
             raise
     
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=256, limit_per_host=64, keepalive_timeout=60),
+                headers={"User-Agent": "algorand-mcp-server"}
+            )
+        return self._http
+
+    async def close(self):
+        """Release the shared HTTP session"""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+
+    async def _request(self, method: str, url: str, error_cls, headers: dict,
+                       params: Optional[dict] = None, data: Optional[bytes] = None) -> dict:
+        """Send a request over the shared session, retrying transient failures with backoff"""
+        session = await self._get_http()
+        for attempt in range(HTTP_MAX_RETRIES):
+            last_attempt = attempt == HTTP_MAX_RETRIES - 1
+            try:
+                async with self._http_limiter:
+                    async with session.request(method, url, params=params, data=data, headers=headers) as resp:
+                        body = await resp.read()
+                        if resp.status < 400:
+                            return orjson.loads(body) if body else {}
+                        if last_attempt or resp.status not in RETRYABLE_STATUSES:
+                            raise error_cls(_http_error_message(body))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+            await asyncio.sleep(HTTP_BACKOFF_BASE * 2 ** attempt)
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking SDK call in a worker thread under the shared concurrency cap"""
+        async with self._http_limiter:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _algod_request(self, method: str, path: str, params: Optional[dict] = None,
+                             data: Optional[bytes] = None, headers: Optional[dict] = None) -> dict:
+        request_headers = {constants.algod_auth_header: self.config.algod_token}
+        if headers:
+            request_headers.update(headers)
+        return await self._request(
+            method, self.config.algod_address + "/v2" + path, error.AlgodHTTPError,
+            request_headers, params, data
+        )
+
+    async def _indexer_request(self, path: str, params: Optional[dict] = None) -> dict:
+        request_headers = {}
+        if self.config.indexer_token:
+            request_headers[constants.indexer_auth_header] = self.config.indexer_token
+        return await self._request(
+            "GET", self.config.indexer_address + "/v2" + path, error.IndexerHTTPError,
+            request_headers, _query_params(params or {})
+        )
+
+    async def _algod_account_info(self, address: str) -> dict:
+        return await self._algod_request("GET", f"/accounts/{address}")
+
+    async def _algod_status(self) -> dict:
+        return await self._algod_request("GET", "/status")
+
+    async def _algod_suggested_params(self) -> transaction.SuggestedParams:
+        params = await self._algod_request("GET", "/transactions/params")
+        return transaction.SuggestedParams(
+            params["fee"],
+            params["last-round"],
+            params["last-round"] + 1000,
+            params["genesis-hash"],
+            params["genesis-id"],
+            False,
+            params["consensus-version"],
+            params["min-fee"]
+        )
+
+    async def _suggested_params(self) -> transaction.SuggestedParams:
+        """Return suggested params, refetching at most once per SUGGESTED_PARAMS_TTL"""
+        async with self._params_lock:
+            now = time.monotonic()
+            if self._params_cache is None or now >= self._params_cache[0]:
+                params = await self._algod_suggested_params()
+                self._params_cache = (now + SUGGESTED_PARAMS_TTL, params)
+            return self._params_cache[1]
+
+    async def _algod_send_transaction(self, signed_txn) -> str:
+        response = await self._algod_request(
+            "POST", "/transactions",
+            data=base64.b64decode(encoding.msgpack_encode(signed_txn)),
+            headers={"Content-Type": "application/x-binary"}
+        )
+        return response["txId"]
+
+    async def _indexer_transaction(self, tx_id: str) -> dict:
+        return await self._indexer_request(f"/transactions/{tx_id}")
+
+    async def _indexer_search_transactions(self, **params) -> dict:
+        return await self._indexer_request("/transactions", params)
+
+    async def start_metrics_server(self, host: str = "127.0.0.1", port: int = 9100) -> web.AppRunner:
+        """Expose Prometheus metrics on /metrics via an aiohttp side-server"""
+        async def handle_metrics(request: web.Request) -> web.Response:
+            return web.Response(
+                body=generate_latest(),
+                headers={"Content-Type": CONTENT_TYPE_LATEST}
+            )
+
+        app = web.Application()
+        app.router.add_get("/metrics", handle_metrics)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        logger.info(f"Metrics available at http://{host}:{port}/metrics")
+        return runner
+
+    async def run(self):
+        """Serve MCP over stdio, with the metrics side-server when metrics_port is set"""
+        metrics_runner = None
+        if self.config.metrics_port is not None:
+            metrics_runner = await self.start_metrics_server(self.config.metrics_host, self.config.metrics_port)
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(read_stream, write_stream, self.server.create_initialization_options())
+        finally:
+            if metrics_runner is not None:
+                await metrics_runner.cleanup()
+            await self.close()
+
+    async def _compile_teal(self, source: str):
+        """Compile TEAL source, preferring a local goal binary and caching by source digest"""
+        key = hashlib.blake2b(source.encode()).digest()
+        cached = self._teal_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        compiled = None
+        if shutil.which("goal"):
+            compiled = await self._compile_teal_locally(source)
+        if compiled is None:
+            compile_result = await self._run_blocking(self.algod_client.compile, source)
+            compiled = (base64.b64decode(compile_result["result"]), compile_result["hash"])
+        
+        self._teal_cache[key] = compiled
+        return compiled
+
+    async def _compile_teal_locally(self, source: str):
+        """Compile TEAL with `goal clerk compile`, returning None if it fails"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_path = os.path.join(tmp_dir, "program.teal")
+            output_path = os.path.join(tmp_dir, "program.tok")
+            with open(source_path, "w", encoding="utf-8") as source_file:
+                source_file.write(source)
+            
+            process = await asyncio.create_subprocess_exec(
+                "goal", "clerk", "compile", source_path, "-o", output_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await process.communicate()
+            if process.returncode != 0:
+                logger.debug(f"Local TEAL compile failed, falling back to algod: {stderr.decode().strip()}")
+                return None
+            
+            with open(output_path, "rb") as output_file:
+                binary = output_file.read()
+        
+        # The program hash algod reports is the logic-sig address of the bytecode
+        return binary, logic.address(binary)
+
+    def _process_transaction(self, txn: dict) -> dict:
+        """Flatten an indexer transaction into the account history shape"""
+        tx_type = txn.get("tx-type", "unknown")
+        processed_txn = {
+            "id": txn.get("id"),
+            "type": tx_type,
+            "round": txn.get("confirmed-round"),
+            "timestamp": _format_utc(txn.get("round-time") or 0),
+            "fee": txn.get("fee", 0),
+            "sender": txn.get("sender")
+        }
+        
+        # Add type-specific information
+        extract = self._txn_extractors.get(tx_type)
+        if extract:
+            processed_txn.update(extract(txn))
+        return processed_txn
+
+    @staticmethod
+    def _keypair_from_seed(seed: bytes):
+        """Derive an Algorand (private_key, address, mnemonic) triple from a 32-byte seed"""
+        signing_key = SigningKey(seed)
+        verify_key = signing_key.verify_key.encode()
+        private_key = base64.b64encode(signing_key.encode() + verify_key).decode()
+        return private_key, encode_address(verify_key), mnemonic.from_private_key(private_key)
+
     def _register_tools(self):
         """Register all MCP tools"""
         
         # ======================= ACCOUNT TOOLS =======================
         
         @self.server.call_tool()
+        @_instrumented("create_account")
         async def create_account(arguments: dict) -> List[TextContent]:
             """Create a new Algorand account with private key and mnemonic"""
             try:
@@ -105,21 +555,16 @@ class AlgorandMCPServer:
                     "private_key": private_key,
                     "mnemonic": account_mnemonic,
                     "network": self.config.network,
-                    "created_at": datetime.now().isoformat()
+                    "created_at": datetime.now(timezone.utc).replace(microsecond=0)
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error creating account: {str(e)}"
-                )]
+                return _error_response("create_account", e)
         
         @self.server.call_tool()
+        @_instrumented("get_account_info")
         async def get_account_info(arguments: dict) -> List[TextContent]:
             """Get detailed account information including balance and assets"""
             try:
@@ -127,43 +572,74 @@ class AlgorandMCPServer:
                 if not address:
                     raise ValueError("Address is required")
                 
-                # Get account info from algod
-                account_info = self.algod_client.account_info(address)
+                # algod already reports created apps, so no indexer round-trip is needed
+                account_info = await self._algod_account_info(address)
+                created_apps = account_info.get("created-apps", [])
+                
+                result = AccountInfoResult(
+                    address=address,
+                    balance_algo=account_info["amount"] / MICROALGOS_PER_ALGO,
+                    balance_microalgo=account_info["amount"],
+                    minimum_balance=account_info["min-balance"] / MICROALGOS_PER_ALGO,
+                    round=account_info["round"],
+                    status=account_info["status"],
+                    assets=account_info.get("assets", []),
+                    created_apps=created_apps,
+                    apps_local_state=account_info.get("apps-local-state", []),
+                    participation=account_info.get("participation", {}),
+                    created_apps_count=len(created_apps),
+                    network=self.config.network
+                )
+                
+                return _text(result)
+                
+            except Exception as e:
+                return _error_response("get_account_info", e)
+
+        @self.server.call_tool()
+        @_instrumented("get_accounts_info")
+        async def get_accounts_info(arguments: dict) -> List[TextContent]:
+            """Get balance and asset information for many accounts at once"""
+            try:
+                addresses = arguments.get("addresses", [])
+                if not addresses:
+                    raise ValueError("addresses is required")
+                
+                # Fan out over the pooled session; _request caps in-flight calls
+                responses = await asyncio.gather(
+                    *(self._algod_account_info(address) for address in addresses),
+                    return_exceptions=True
+                )
                 
-                # Get additional info from indexer
-                try:
-                    indexer_info = self.indexer_client.account_info(address)
-                    transactions_count = len(indexer_info.get("account", {}).get("created-apps", []))
-                except:
-                    transactions_count = 0
+                accounts = []
+                for address, account_info in zip(addresses, responses):
+                    if isinstance(account_info, Exception):
+                        accounts.append({"address": address, "error": str(account_info)})
+                        continue
+                    accounts.append({
+                        "address": address,
+                        "balance_algo": account_info["amount"] / MICROALGOS_PER_ALGO,
+                        "balance_microalgo": account_info["amount"],
+                        "minimum_balance": account_info["min-balance"] / MICROALGOS_PER_ALGO,
+                        "round": account_info["round"],
+                        "status": account_info["status"],
+                        "assets": account_info.get("assets", []),
+                        "created_apps_count": len(account_info.get("created-apps", []))
+                    })
                 
                 result = {
-                    "address": address,
-                    "balance_algo": microalgos_to_algos(account_info["amount"]),
-                    "balance_microalgo": account_info["amount"],
-                    "minimum_balance": microalgos_to_algos(account_info["min-balance"]),
-                    "round": account_info["round"],
-                    "status": account_info["status"],
-                    "assets": account_info.get("assets", []),
-                    "created_apps": account_info.get("created-apps", []),
-                    "apps_local_state": account_info.get("apps-local-state", []),
-                    "participation": account_info.get("participation", {}),
-                    "transactions_count": transactions_count,
+                    "account_count": len(accounts),
+                    "accounts": accounts,
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error getting account info: {str(e)}"
-                )]
+                return _error_response("get_accounts_info", e)
         
         @self.server.call_tool()
+        @_instrumented("restore_account_from_mnemonic")
         async def restore_account_from_mnemonic(arguments: dict) -> List[TextContent]:
             """Restore account from mnemonic phrase"""
             try:
@@ -171,31 +647,67 @@ class AlgorandMCPServer:
                 if not mnemonic_phrase:
                     raise ValueError("Mnemonic phrase is required")
                 
-                private_key = mnemonic.to_private_key(mnemonic_phrase)
-                address = address_from_private_key(private_key)
+                private_key = _mnemonic_to_private_key(mnemonic_phrase)
+                address = _address_from_private_key(private_key)
                 
                 result = {
                     "address": address,
                     "private_key": private_key,
                     "mnemonic": mnemonic_phrase,
                     "network": self.config.network,
-                    "restored_at": datetime.now().isoformat()
+                    "restored_at": datetime.now(timezone.utc).replace(microsecond=0)
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error restoring account: {str(e)}"
-                )]
+                return _error_response("restore_account_from_mnemonic", e)
+
+        @self.server.call_tool()
+        @_instrumented("create_accounts_batch")
+        async def create_accounts_batch(arguments: dict) -> List[TextContent]:
+            """Generate many Algorand accounts at once"""
+            try:
+                count = int(arguments.get("count", 1))
+                if not 1 <= count <= 10000:
+                    raise ValueError("count must be between 1 and 10000")
+
+                # Draw all 32-byte seeds from the DRBG in one keystream read
+                keystream = self._key_drbg.encrypt(bytes(32 * count))
+                seeds = [keystream[i:i + 32] for i in range(0, len(keystream), 32)]
+
+                # ed25519 key derivation runs in C and releases the GIL; the mnemonic
+                # encoding rides along so none of the per-account work stays on the loop
+                loop = asyncio.get_running_loop()
+                keypairs = await asyncio.gather(*(
+                    loop.run_in_executor(self._key_executor, self._keypair_from_seed, seed)
+                    for seed in seeds
+                ))
+
+                created_at = datetime.now(timezone.utc).replace(microsecond=0)
+                result = {
+                    "accounts": [
+                        {
+                            "address": address,
+                            "private_key": private_key,
+                            "mnemonic": account_mnemonic
+                        }
+                        for private_key, address, account_mnemonic in keypairs
+                    ],
+                    "count": count,
+                    "network": self.config.network,
+                    "created_at": created_at
+                }
+
+                return _text(result)
+
+            except Exception as e:
+                return _error_response("create_accounts_batch", e)
         
         # ======================= TRANSACTION TOOLS =======================
         
         @self.server.call_tool()
+        @_instrumented("send_payment")
         async def send_payment(arguments: dict) -> List[TextContent]:
             """Send ALGO payment transaction"""
             try:
@@ -207,11 +719,13 @@ class AlgorandMCPServer:
                 if not all([sender_private_key, receiver_address, amount_algo]):
                     raise ValueError("sender_private_key, receiver_address, and amount_algo are required")
                 
-                sender_address = address_from_private_key(sender_private_key)
-                amount_microalgo = algos_to_microalgos(amount_algo)
+                amount_microalgo = int(round(amount_algo * MICROALGOS_PER_ALGO))
+                note_bytes = note.encode("utf-8") if note else None
+                
+                sender_address = _address_from_private_key(sender_private_key)
                 
                 # Get suggested parameters
-                params = self.algod_client.suggested_params()
+                params = await self._suggested_params()
                 
                 # Create transaction
                 txn = PaymentTxn(
@@ -219,17 +733,17 @@ class AlgorandMCPServer:
                     sp=params,
                     receiver=receiver_address,
                     amt=amount_microalgo,
-                    note=note.encode() if note else None
+                    note=note_bytes
                 )
                 
                 # Sign transaction
                 signed_txn = txn.sign(sender_private_key)
                 
                 # Send transaction
-                tx_id = self.algod_client.send_transaction(signed_txn)
+                tx_id = await self._algod_send_transaction(signed_txn)
                 
                 # Wait for confirmation
-                confirmed_txn = transaction.wait_for_confirmation(self.algod_client, tx_id, 4)
+                confirmed_txn = await self._run_blocking(transaction.wait_for_confirmation, self.algod_client, tx_id, 4)
                 
                 result = {
                     "transaction_id": tx_id,
@@ -243,18 +757,83 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error sending payment: {str(e)}"
-                )]
-        
+                return _error_response("send_payment", e)
+
+        @self.server.call_tool()
+        @_instrumented("send_payment_batch")
+        async def send_payment_batch(arguments: dict) -> List[TextContent]:
+            """Send up to 16 ALGO payments as one atomic transaction group"""
+            try:
+                payments = arguments.get("transactions", [])
+
+                if not payments:
+                    raise ValueError("transactions is required")
+                if len(payments) > 16:
+                    raise ValueError("A transaction group can hold at most 16 transactions")
+
+                # Get suggested parameters once for the whole group
+                params = await self._suggested_params()
+
+                # Create transactions
+                txns = []
+                senders = []
+                for payment in payments:
+                    sender_private_key = payment.get("sender_private_key")
+                    receiver_address = payment.get("receiver_address")
+                    amount_algo = float(payment.get("amount_algo", 0))
+                    note = payment.get("note", "")
+
+                    if not all([sender_private_key, receiver_address, amount_algo]):
+                        raise ValueError("sender_private_key, receiver_address, and amount_algo are required")
+
+                    sender_address = _address_from_private_key(sender_private_key)
+                    txns.append(PaymentTxn(
+                        sender=sender_address,
+                        sp=params,
+                        receiver=receiver_address,
+                        amt=int(round(amount_algo * MICROALGOS_PER_ALGO)),
+                        note=note.encode() if note else None
+                    ))
+                    senders.append((sender_private_key, sender_address))
+
+                # Group and sign transactions
+                transaction.assign_group_id(txns)
+                signed_txns = [
+                    txn.sign(private_key)
+                    for txn, (private_key, _) in zip(txns, senders)
+                ]
+
+                # Send the whole group in a single call
+                tx_id = await self._run_blocking(self.algod_client.send_transactions, signed_txns)
+
+                # Wait for confirmation once, all grouped txns confirm in the same round
+                confirmed_txn = await self._run_blocking(transaction.wait_for_confirmation, self.algod_client, tx_id, 4)
+
+                result = {
+                    "group_id": base64.b64encode(txns[0].group).decode(),
+                    "transaction_ids": [signed_txn.get_txid() for signed_txn in signed_txns],
+                    "payments": [
+                        {
+                            "sender": sender_address,
+                            "receiver": txn.receiver,
+                            "amount_microalgo": txn.amt
+                        }
+                        for txn, (_, sender_address) in zip(txns, senders)
+                    ],
+                    "confirmed_round": confirmed_txn["confirmed-round"],
+                    "network": self.config.network
+                }
+
+                return _text(result)
+
+            except Exception as e:
+                return _error_response("send_payment_batch", e)
+
         @self.server.call_tool()
+        @_instrumented("get_transaction")
         async def get_transaction(arguments: dict) -> List[TextContent]:
             """Get detailed transaction information"""
             try:
@@ -263,7 +842,7 @@ class AlgorandMCPServer:
                     raise ValueError("transaction_id is required")
                 
                 # Get transaction from indexer
-                txn_info = self.indexer_client.transaction(tx_id)
+                txn_info = await self._indexer_transaction(tx_id)
                 
                 result = {
                     "transaction_id": tx_id,
@@ -271,20 +850,15 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error getting transaction: {str(e)}"
-                )]
+                return _error_response("get_transaction", e)
         
         # ======================= ASSET TOOLS =======================
         
         @self.server.call_tool()
+        @_instrumented("create_asset")
         async def create_asset(arguments: dict) -> List[TextContent]:
             """Create a new Algorand Standard Asset (ASA)"""
             try:
@@ -300,10 +874,10 @@ class AlgorandMCPServer:
                 if not all([creator_private_key, asset_name, unit_name]):
                     raise ValueError("creator_private_key, asset_name, and unit_name are required")
                 
-                creator_address = address_from_private_key(creator_private_key)
+                creator_address = _address_from_private_key(creator_private_key)
                 
                 # Get suggested parameters
-                params = self.algod_client.suggested_params()
+                params = await self._suggested_params()
                 
                 # Create asset creation transaction
                 txn = AssetCreateTxn(
@@ -324,10 +898,10 @@ class AlgorandMCPServer:
                 
                 # Sign and send transaction
                 signed_txn = txn.sign(creator_private_key)
-                tx_id = self.algod_client.send_transaction(signed_txn)
+                tx_id = await self._algod_send_transaction(signed_txn)
                 
                 # Wait for confirmation
-                confirmed_txn = transaction.wait_for_confirmation(self.algod_client, tx_id, 4)
+                confirmed_txn = await self._run_blocking(transaction.wait_for_confirmation, self.algod_client, tx_id, 4)
                 
                 # Get asset ID
                 asset_id = confirmed_txn["asset-index"]
@@ -344,18 +918,13 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error creating asset: {str(e)}"
-                )]
+                return _error_response("create_asset", e)
         
         @self.server.call_tool()
+        @_instrumented("transfer_asset")
         async def transfer_asset(arguments: dict) -> List[TextContent]:
             """Transfer an Algorand Standard Asset (ASA)"""
             try:
@@ -367,10 +936,10 @@ class AlgorandMCPServer:
                 if not all([sender_private_key, receiver_address, asset_id, amount]):
                     raise ValueError("All parameters are required")
                 
-                sender_address = address_from_private_key(sender_private_key)
+                sender_address = _address_from_private_key(sender_private_key)
                 
                 # Get suggested parameters
-                params = self.algod_client.suggested_params()
+                params = await self._suggested_params()
                 
                 # Create asset transfer transaction
                 txn = AssetTransferTxn(
@@ -383,10 +952,10 @@ class AlgorandMCPServer:
                 
                 # Sign and send transaction
                 signed_txn = txn.sign(sender_private_key)
-                tx_id = self.algod_client.send_transaction(signed_txn)
+                tx_id = await self._algod_send_transaction(signed_txn)
                 
                 # Wait for confirmation
-                confirmed_txn = transaction.wait_for_confirmation(self.algod_client, tx_id, 4)
+                confirmed_txn = await self._run_blocking(transaction.wait_for_confirmation, self.algod_client, tx_id, 4)
                 
                 result = {
                     "transaction_id": tx_id,
@@ -398,25 +967,20 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error transferring asset: {str(e)}"
-                )]
+                return _error_response("transfer_asset", e)
         
         @self.server.call_tool()
+        @_instrumented("get_asset_info")
         async def get_asset_info(arguments: dict) -> List[TextContent]:
             """Get detailed information about an asset"""
             try:
                 asset_id = int(arguments.get("asset_id"))
                 
                 # Get asset info
-                asset_info = self.algod_client.asset_info(asset_id)
+                asset_info = await self._run_blocking(self.algod_client.asset_info, asset_id)
                 
                 result = {
                     "asset_id": asset_id,
@@ -424,20 +988,15 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error getting asset info: {str(e)}"
-                )]
+                return _error_response("get_asset_info", e)
         
         # ======================= APPLICATION TOOLS =======================
         
         @self.server.call_tool()
+        @_instrumented("create_application")
         async def create_application(arguments: dict) -> List[TextContent]:
             """Create a new smart contract application"""
             try:
@@ -451,17 +1010,14 @@ class AlgorandMCPServer:
                 if not all([creator_private_key, approval_program, clear_program]):
                     raise ValueError("creator_private_key, approval_program, and clear_program are required")
                 
-                creator_address = address_from_private_key(creator_private_key)
+                creator_address = _address_from_private_key(creator_private_key)
                 
                 # Compile programs
-                approval_result = self.algod_client.compile(approval_program)
-                approval_binary = base64.b64decode(approval_result["result"])
-                
-                clear_result = self.algod_client.compile(clear_program)
-                clear_binary = base64.b64decode(clear_result["result"])
+                approval_binary, approval_hash = await self._compile_teal(approval_program)
+                clear_binary, clear_hash = await self._compile_teal(clear_program)
                 
                 # Get suggested parameters
-                params = self.algod_client.suggested_params()
+                params = await self._suggested_params()
                 
                 # Create application
                 txn = ApplicationCreateTxn(
@@ -483,10 +1039,10 @@ class AlgorandMCPServer:
                 
                 # Sign and send transaction
                 signed_txn = txn.sign(creator_private_key)
-                tx_id = self.algod_client.send_transaction(signed_txn)
+                tx_id = await self._algod_send_transaction(signed_txn)
                 
                 # Wait for confirmation
-                confirmed_txn = transaction.wait_for_confirmation(self.algod_client, tx_id, 4)
+                confirmed_txn = await self._run_blocking(transaction.wait_for_confirmation, self.algod_client, tx_id, 4)
                 
                 # Get application ID
                 app_id = confirmed_txn["application-index"]
@@ -496,23 +1052,18 @@ class AlgorandMCPServer:
                     "application_id": app_id,
                     "creator": creator_address,
                     "confirmed_round": confirmed_txn["confirmed-round"],
-                    "approval_program_hash": approval_result["hash"],
-                    "clear_program_hash": clear_result["hash"],
+                    "approval_program_hash": approval_hash,
+                    "clear_program_hash": clear_hash,
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error creating application: {str(e)}"
-                )]
+                return _error_response("create_application", e)
         
         @self.server.call_tool()
+        @_instrumented("call_application")
         async def call_application(arguments: dict) -> List[TextContent]:
             """Call a smart contract application"""
             try:
@@ -526,10 +1077,10 @@ class AlgorandMCPServer:
                 if not all([caller_private_key, app_id]):
                     raise ValueError("caller_private_key and app_id are required")
                 
-                caller_address = address_from_private_key(caller_private_key)
+                caller_address = _address_from_private_key(caller_private_key)
                 
                 # Get suggested parameters
-                params = self.algod_client.suggested_params()
+                params = await self._suggested_params()
                 
                 # Create application call transaction
                 txn = ApplicationCallTxn(
@@ -545,10 +1096,10 @@ class AlgorandMCPServer:
                 
                 # Sign and send transaction
                 signed_txn = txn.sign(caller_private_key)
-                tx_id = self.algod_client.send_transaction(signed_txn)
+                tx_id = await self._algod_send_transaction(signed_txn)
                 
                 # Wait for confirmation
-                confirmed_txn = transaction.wait_for_confirmation(self.algod_client, tx_id, 4)
+                confirmed_txn = await self._run_blocking(transaction.wait_for_confirmation, self.algod_client, tx_id, 4)
                 
                 result = {
                     "transaction_id": tx_id,
@@ -561,25 +1112,20 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error calling application: {str(e)}"
-                )]
+                return _error_response("call_application", e)
         
         @self.server.call_tool()
+        @_instrumented("get_application_info")
         async def get_application_info(arguments: dict) -> List[TextContent]:
             """Get detailed information about an application"""
             try:
                 app_id = int(arguments.get("app_id"))
                 
                 # Get application info
-                app_info = self.algod_client.application_info(app_id)
+                app_info = await self._run_blocking(self.algod_client.application_info, app_id)
                 
                 result = {
                     "application_id": app_id,
@@ -587,24 +1133,19 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error getting application info: {str(e)}"
-                )]
+                return _error_response("get_application_info", e)
         
         # ======================= BLOCKCHAIN INFO TOOLS =======================
         
         @self.server.call_tool()
+        @_instrumented("get_blockchain_status")
         async def get_blockchain_status(arguments: dict) -> List[TextContent]:
             """Get current blockchain status and network information"""
             try:
-                status = self.algod_client.status()
+                status = await self._algod_status()
                 
                 result = {
                     "network": self.config.network,
@@ -618,51 +1159,41 @@ class AlgorandMCPServer:
                     "stopped_at_unsupported_round": status.get("stopped-at-unsupported-round", False)
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error getting blockchain status: {str(e)}"
-                )]
+                return _error_response("get_blockchain_status", e)
         
         @self.server.call_tool()
+        @_instrumented("get_block_info")
         async def get_block_info(arguments: dict) -> List[TextContent]:
             """Get information about a specific block"""
             try:
                 round_number = arguments.get("round")
                 if round_number is None:
                     # Get latest block
-                    status = self.algod_client.status()
+                    status = await self._algod_status()
                     round_number = status["last-round"]
                 else:
                     round_number = int(round_number)
                 
-                block_info = self.algod_client.block_info(round_number)
+                block_info = await self._run_blocking(self.algod_client.block_info, round_number)
                 
-                result = {
-                    "round": round_number,
-                    "block_info": block_info,
-                    "network": self.config.network
-                }
+                result = BlockInfoResult(
+                    round=round_number,
+                    block_info=block_info,
+                    network=self.config.network
+                )
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error getting block info: {str(e)}"
-                )]
+                return _error_response("get_block_info", e)
         
         # ======================= ADVANCED QUERY TOOLS =======================
         
         @self.server.call_tool()
+        @_instrumented("search_transactions")
         async def search_transactions(arguments: dict) -> List[TextContent]:
             """Search for transactions with various filters"""
             try:
@@ -691,27 +1222,22 @@ class AlgorandMCPServer:
                     search_params["after-time"] = after_time
                 
                 # Search transactions
-                response = self.indexer_client.search_transactions(**search_params)
+                response = await self._run_blocking(self.indexer_client.search_transactions, **search_params)
                 
-                result = {
-                    "search_params": search_params,
-                    "transactions": response["transactions"],
-                    "next_token": response.get("next-token"),
-                    "network": self.config.network
-                }
+                result = SearchTransactionsResult(
+                    search_params=search_params,
+                    transactions=response["transactions"],
+                    next_token=response.get("next-token"),
+                    network=self.config.network
+                )
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error searching transactions: {str(e)}"
-                )]
+                return _error_response("search_transactions", e)
         
         @self.server.call_tool()
+        @_instrumented("get_account_transactions")
         async def get_account_transactions(arguments: dict) -> List[TextContent]:
             """Get transaction history for a specific account"""
             try:
@@ -722,43 +1248,30 @@ class AlgorandMCPServer:
                     raise ValueError("address is required")
                 
                 # Get account transactions
-                response = self.indexer_client.search_transactions(
+                response = await self._indexer_search_transactions(
                     address=address,
                     limit=limit
                 )
                 
-                # Process transactions
-                transactions = []
-                for txn in response["transactions"]:
-                    tx_type = txn.get("tx-type", "unknown")
-                    processed_txn = {
-                        "id": txn["id"],
-                        "type": tx_type,
-                        "round": txn["confirmed-round"],
-                        "timestamp": datetime.fromtimestamp(txn["round-time"]).isoformat(),
-                        "fee": txn["fee"],
-                        "sender": txn["sender"]
+                # Columnar output skips building a dict per transaction
+                if arguments.get("columnar", False):
+                    columns = _transaction_columns(response["transactions"])
+                    result = {
+                        "address": address,
+                        "transaction_count": len(columns["id"]),
+                        "columns": columns,
+                        "network": self.config.network
                     }
-                    
-                    # Add type-specific information
-                    if tx_type == "pay":
-                        processed_txn.update({
-                            "receiver": txn["payment-transaction"]["receiver"],
-                            "amount": txn["payment-transaction"]["amount"],
-                            "amount_algo": microalgos_to_algos(txn["payment-transaction"]["amount"])
-                        })
-                    elif tx_type == "axfer":
-                        processed_txn.update({
-                            "asset_id": txn["asset-transfer-transaction"]["asset-id"],
-                            "receiver": txn["asset-transfer-transaction"]["receiver"],
-                            "amount": txn["asset-transfer-transaction"]["amount"]
-                        })
-                    elif tx_type == "appl":
-                        processed_txn.update({
-                            "application_id": txn["application-transaction"]["application-id"]
-                        })
-                    
-                    transactions.append(processed_txn)
+                    return _text(result)
+                
+                # Process transactions
+                transactions = [self._process_transaction(txn) for txn in response["transactions"]]
+                
+                # Convert all payment amounts in one pass
+                payments = [txn for txn in transactions if txn["type"] == "pay"]
+                amounts_algo = microalgos_to_algos_batch([txn["amount"] for txn in payments])
+                for txn, amount_algo in zip(payments, amounts_algo):
+                    txn["amount_algo"] = amount_algo
                 
                 result = {
                     "address": address,
@@ -767,16 +1280,10 @@ class AlgorandMCPServer:
                     "network": self.config.network
                 }
                 
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                return _text(result)
                 
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error getting account transactions: {str(e)}"
-                )]
+                return _error_response("get_account_transactions", e)
     
     def _register_resources(self):
         """Register MCP resources"""
@@ -784,17 +1291,11 @@ class AlgorandMCPServer:
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
             """List available resources"""
-            return [
-                Resource(
-                    uri="algorand://network/status",
-                    name="Network Status",
-                    description="Current Algorand network status and information",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="algorand://tools/documentation",
-                    name="Tool Documentation",
-                    description="Documentation for all available Algorand tools",
-                    mimeType="text/markdown"
-                )
-            ]
\ No newline at end of file
+            return STATIC_RESOURCES
+
+
+if __name__ == "__main__":
+    metrics_port = os.environ.get("ALGORAND_MCP_METRICS_PORT")
+    asyncio.run(AlgorandMCPServer(AlgorandConfig(
+        metrics_port=int(metrics_port) if metrics_port else None
+    )).run())
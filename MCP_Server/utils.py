@@ -1,14 +1,17 @@
 import asyncio
-import json
 import logging
 from typing import Any, Dict, List, Optional, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import base64
 import hashlib
+import time
 
+import httpx
+import orjson
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
+from mcp.server.stdio import stdio_server
 from mcp.types import (
     Resource, Tool, TextContent, ImageContent, EmbeddedResource,
     LoggingLevel, CallToolResult, ListResourcesResult, ListToolsResult,
@@ -29,7 +32,18 @@ from algosdk.encoding import encode_address, decode_address
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("algorand-mcp")
 
-@dataclass 
+
+def _sha512_256(data: bytes) -> bytes:
+    """SHA-512/256 digest through OpenSSL, which uses SHA CPU extensions when present"""
+    return hashlib.new("sha512_256", data).digest()
+
+
+# algosdk computes address and txid checksums with pycryptodome's SHA512; point
+# it at hashlib when the linked OpenSSL provides sha512_256
+if "sha512_256" in hashlib.algorithms_available:
+    encoding.checksum = _sha512_256
+
+@dataclass(slots=True)
 class AlgorandConfig:
     """Configuration for Algorand network connections"""
     algod_address: str = "https://testnet-api.algonode.cloud"
@@ -37,17 +51,513 @@ class AlgorandConfig:
     indexer_address: str = "https://testnet-idx.algonode.cloud"  
     indexer_token: str = ""
     network: str = "testnet"  # testnet, mainnet, betanet
+    popular_asset_ids: tuple = ()  # Curated ASA IDs served by algorand://assets/popular
+    popular_app_ids: tuple = ()  # Curated app IDs served by algorand://apps/popular
+
+
+# Resources never change at runtime, so build them once
+STATIC_RESOURCES = [
+    types.Resource(
+        uri=AnyUrl("algorand://network/status"),
+        name="Network Status",
+        description="Current Algorand network status and health",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri=AnyUrl("algorand://network/params"), 
+        name="Network Parameters",
+        description="Algorand network consensus parameters",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri=AnyUrl("algorand://blocks/latest"),
+        name="Latest Block",
+        description="Information about the latest block",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri=AnyUrl("algorand://assets/popular"),
+        name="Popular Assets", 
+        description="List of popular ASAs on Algorand",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri=AnyUrl("algorand://apps/popular"),
+        name="Popular Applications",
+        description="List of popular dApps on Algorand", 
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri=AnyUrl("algorand://stats/daily"),
+        name="Daily Statistics",
+        description="Daily network statistics and metrics",
+        mimeType="application/json",
+    ),
+]
+
+# Resource URI -> name of the coroutine method that produces its payload
+RESOURCE_READERS = {
+    "algorand://network/status": "_get_network_status",
+    "algorand://network/params": "_get_network_params",
+    "algorand://blocks/latest": "_get_latest_block",
+    "algorand://assets/popular": "_get_popular_assets",
+    "algorand://apps/popular": "_get_popular_apps",
+    "algorand://stats/daily": "_get_daily_stats",
+}
+
+# Default number of in-flight upstream lookups for the *_batch tools
+BATCH_MAX_WORKERS = 10
+# In-flight lookups when assembling a composite resource
+RESOURCE_FAN_OUT = 8
+# algorand://stats/daily samples this many blocks spread over the last
+# DAILY_STATS_ROUNDS rounds (about a day at ~2.9 s per round)
+DAILY_STATS_SAMPLES = 16
+DAILY_STATS_ROUNDS = 30_000
+
+# Tool definitions never change at runtime, so build them once
+STATIC_TOOLS = [
+    # Account Management Tools
+    Tool(
+        name="create_account",
+        description="Generate a new Algorand account with mnemonic",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+    ),
+    Tool(
+        name="account_info",
+        description="Get detailed account information",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "address": {"type": "string", "description": "Account address"}
+            },
+            "required": ["address"]
+        },
+    ),
+    Tool(
+        name="account_balance",
+        description="Get account ALGO balance",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": {"type": "string", "description": "Account address"}
+            },
+            "required": ["address"]
+        },
+    ),
+    Tool(
+        name="account_assets",
+        description="List all assets held by an account", 
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": {"type": "string", "description": "Account address"}
+            },
+            "required": ["address"]
+        },
+    ),
+    Tool(
+        name="account_applications",
+        description="List applications created or opted into by account",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": {"type": "string", "description": "Account address"}
+            },
+            "required": ["address"]
+        },
+    ),
+    Tool(
+        name="account_transactions",
+        description="Get account transaction history",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": {"type": "string", "description": "Account address"},
+                "limit": {"type": "integer", "description": "Number of transactions", "default": 50},
+                "next_token": {"type": "string", "description": "Pagination token", "default": ""}
+            },
+            "required": ["address"]
+        },
+    ),
+    # Transaction Tools
+    Tool(
+        name="create_payment_txn",
+        description="Create a payment transaction",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sender": {"type": "string", "description": "Sender address"},
+                "receiver": {"type": "string", "description": "Receiver address"}, 
+                "amount": {"type": "integer", "description": "Amount in microAlgos"},
+                "note": {"type": "string", "description": "Transaction note", "default": ""}
+            },
+            "required": ["sender", "receiver", "amount"]
+        },
+    ),
+    Tool(
+        name="send_payment",
+        description="Send ALGO payment (requires private key)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "private_key": {"type": "string", "description": "Sender private key"},
+                "receiver": {"type": "string", "description": "Receiver address"},
+                "amount": {"type": "integer", "description": "Amount in microAlgos"},
+                "note": {"type": "string", "description": "Transaction note", "default": ""}
+            },
+            "required": ["private_key", "receiver", "amount"]
+        },
+    ),
+    Tool(
+        name="transaction_info",
+        description="Get transaction details by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "txid": {"type": "string", "description": "Transaction ID"}
+            },
+            "required": ["txid"]
+        },
+    ),
+    Tool(
+        name="pending_transactions",
+        description="Get pending transactions from pool",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max": {"type": "integer", "description": "Maximum transactions", "default": 10}
+            },
+            "required": []
+        },
+    ),
+
+    # Asset Tools
+    Tool(
+        name="create_asset",
+        description="Create a new ASA (Algorand Standard Asset)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "private_key": {"type": "string", "description": "Creator private key"},
+                "asset_name": {"type": "string", "description": "Asset name"},
+                "unit_name": {"type": "string", "description": "Asset unit name"},
+                "total": {"type": "integer", "description": "Total supply"},
+                "decimals": {"type": "integer", "description": "Decimal places", "default": 0},
+                "url": {"type": "string", "description": "Asset URL", "default": ""},
+                "metadata_hash": {"type": "string", "description": "Metadata hash", "default": ""}
+            },
+            "required": ["private_key", "asset_name", "unit_name", "total"]
+        },
+    ),
+    Tool(
+        name="asset_info",
+        description="Get asset information by ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "asset_id": {"type": "integer", "description": "Asset ID"}
+            },
+            "required": ["asset_id"]
+        },
+    ),
+    Tool(
+        name="asset_balances",
+        description="Get all holders of an asset",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "asset_id": {"type": "integer", "description": "Asset ID"},
+                "limit": {"type": "integer", "description": "Number of results", "default": 100}
+            },
+            "required": ["asset_id"]
+        },
+    ),
+    Tool(
+        name="opt_in_asset",
+        description="Opt into an asset",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "private_key": {"type": "string", "description": "Account private key"},
+                "asset_id": {"type": "integer", "description": "Asset ID"}
+            },
+            "required": ["private_key", "asset_id"]
+        },
+    ),
+    Tool(
+        name="transfer_asset",
+        description="Transfer ASA tokens",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "private_key": {"type": "string", "description": "Sender private key"},
+                "asset_id": {"type": "integer", "description": "Asset ID"},
+                "receiver": {"type": "string", "description": "Receiver address"},
+                "amount": {"type": "integer", "description": "Amount to transfer"}
+            },
+            "required": ["private_key", "asset_id", "receiver", "amount"]
+        },
+    ),
+    Tool(
+        name="application_state",
+        description="Get application global state",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_id": {"type": "integer", "description": "Application ID"}
+            },
+            "required": ["app_id"]
+        },
+    ),
+    Tool(
+        name="account_app_state",
+        description="Get account's local state for an application",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": {"type": "string", "description": "Account address"},
+                "app_id": {"type": "integer", "description": "Application ID"}
+            },
+            "required": ["address", "app_id"]
+        },
+    ),
+
+    Tool(
+        name="validate_address",
+        description="Validate an Algorand address",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": {"type": "string", "description": "Address to validate"}
+            },
+            "required": ["address"]
+        },
+    ),
+    Tool(
+        name="encode_address",
+        description="Encode public key to address",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "public_key": {"type": "string", "description": "Base64 encoded public key"}
+            },
+            "required": ["public_key"]
+        },
+    ),
+    Tool(
+        name="decode_address", 
+        description="Decode address to public key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": {"type": "string", "description": "Algorand address"}
+            },
+            "required": ["address"]
+        },
+    ),
+    Tool(
+        name="mnemonic_to_private_key",
+        description="Convert mnemonic to private key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mnemonic": {"type": "string", "description": "25-word mnemonic"}
+            },
+            "required": ["mnemonic"]
+        },
+    ),
+    Tool(
+        name="private_key_to_address",
+        description="Get address from private key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "private_key": {"type": "string", "description": "Private key"}
+            },
+            "required": ["private_key"]
+        },
+    ),
+
+    # Search Tools
+    Tool(
+        name="search_transactions",
+        description="Search transactions with filters",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "asset_id": {"type": "integer", "description": "Asset ID filter"},
+                "address": {"type": "string", "description": "Address filter"},
+                "tx_type": {"type": "string", "description": "Transaction type filter"},
+                "limit": {"type": "integer", "description": "Number of results", "default": 50}
+            },
+            "required": []
+        },
+    ),
+    Tool(
+        name="search_assets",
+        description="Search assets by name or creator",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Asset name filter"},
+                "creator": {"type": "string", "description": "Creator address filter"},
+                "limit": {"type": "integer", "description": "Number of results", "default": 50}
+            },
+            "required": []
+        },
+    ),
+    Tool(
+        name="search_applications",
+        description="Search applications by creator",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "creator": {"type": "string", "description": "Creator address filter"},
+                "limit": {"type": "integer", "description": "Number of results", "default": 50}
+            },
+            "required": []
+        },
+    ),
+
+    # Batch Tools
+    Tool(
+        name="account_info_batch",
+        description="Get account information for many addresses concurrently",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "addresses": {"type": "array", "items": {"type": "string"}, "description": "Account addresses"},
+                "max_workers": {"type": "integer", "description": "Maximum concurrent lookups", "default": BATCH_MAX_WORKERS}
+            },
+            "required": ["addresses"]
+        },
+    ),
+    Tool(
+        name="asset_info_batch",
+        description="Get asset information for many asset IDs concurrently",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "asset_ids": {"type": "array", "items": {"type": "integer"}, "description": "Asset IDs"},
+                "max_workers": {"type": "integer", "description": "Maximum concurrent lookups", "default": BATCH_MAX_WORKERS}
+            },
+            "required": ["asset_ids"]
+        },
+    ),
+]
+
+# Seconds a resource payload stays fresh; URIs not listed are never cached.
+# Consensus params only move on protocol upgrades and the popular lists are
+# curated, while the latest block turns over every round
+RESOURCE_TTLS = {
+    "algorand://network/params": 3600.0,
+    "algorand://assets/popular": 600.0,
+    "algorand://apps/popular": 600.0,
+    "algorand://blocks/latest": 2.0,
+    "algorand://stats/daily": 300.0,
+}
+
+_ERROR_TMPL = "Error: {err}"
+
+
+def _json(obj: Any, indent: bool = True) -> str:
+    """Serialize a payload for TextContent with orjson's C encoder"""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option).decode()
+
+
+class AsyncAlgodHTTP:
+    """Non-blocking algod v2 client over a shared httpx.AsyncClient"""
+
+    def __init__(self, http: httpx.AsyncClient, address: str, token: str):
+        self._http = http
+        self._base = f"{address}/v2"
+        self._headers = {constants.algod_auth_header: token}
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        response = await self._http.get(self._base + path, params=params, headers=self._headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def status(self) -> Dict[str, Any]:
+        return await self._get("/status")
+
+    async def suggested_params(self) -> Dict[str, Any]:
+        return await self._get("/transactions/params")
+
+    async def block_info(self, round_num: int) -> Dict[str, Any]:
+        return await self._get(f"/blocks/{round_num}", {"format": "json"})
+
+    async def account_info(self, address: str) -> Dict[str, Any]:
+        return await self._get(f"/accounts/{address}")
+
+    async def asset_info(self, asset_id: int) -> Dict[str, Any]:
+        return await self._get(f"/assets/{asset_id}")
+
+    async def application_info(self, app_id: int) -> Dict[str, Any]:
+        return await self._get(f"/applications/{app_id}")
 
 
 class AlgoUtils:
+    __slots__ = (
+        "config", "server", "algod_client", "indexer_client", "_http", "_algod",
+        "_tools_result", "_resources_result", "_cache", "_cache_locks",
+    )
+
     def __init__(self, config: AlgorandConfig):
         self.config = config
         self.server = Server("algorand-mcp")
         self.algod_client = None
         self.indexer_client = None
+        # One pooled HTTP/2 client shared by every async algod/indexer read, so
+        # concurrent requests multiplex over a single connection per host
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=30
+        )
+        self._algod = AsyncAlgodHTTP(self._http, config.algod_address, config.algod_token)
+        # Listing results are immutable, so handlers return these prebuilt objects
+        self._tools_result = ListToolsResult(tools=STATIC_TOOLS)
+        self._resources_result = ListResourcesResult(resources=STATIC_RESOURCES)
+        # key -> (fetched_at, value); one lock per key coalesces concurrent misses
+        self._cache: Dict[str, tuple] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
         self._setup_clients()
         self._register_handlers()
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._http.aclose()
+
+    async def run(self):
+        """Serve the registered handlers over stdio until the client disconnects"""
+        async with stdio_server() as (read_stream, write_stream):
+            await self.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="algorand-mcp",
+                    server_version="1.0.0",
+                    capabilities=self.server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
+                )
+            )
+
 
     def _setup_clients(self):
         """Initialize Algorand clients"""
@@ -65,6 +575,157 @@ class AlgoUtils:
             logger.error(f"Failed to initialize Algorand clients: {e}")
             raise
 
+    async def _indexer_get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET an indexer v2 endpoint over the shared HTTP client"""
+        headers = {}
+        if self.config.indexer_token:
+            headers[constants.indexer_auth_header] = self.config.indexer_token
+        response = await self._http.get(
+            f"{self.config.indexer_address}/v2{path}",
+            params=params,
+            headers=headers
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _cached(self, key: str, ttl: float, fn) -> Any:
+        """Return the cached result of fn() for key, refreshing it after ttl seconds"""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the entry while we waited
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+            value = await fn()
+            self._cache[key] = (time.monotonic(), value)
+            return value
+
+    async def _fan_out(self, fetch, keys: Sequence[Any]) -> List[Any]:
+        """Fetch every key concurrently, dropping the lookups that failed"""
+        sem = asyncio.Semaphore(RESOURCE_FAN_OUT)
+        
+        async def one(key):
+            async with sem:
+                return await fetch(key)
+        
+        results = await asyncio.gather(*(one(key) for key in keys), return_exceptions=True)
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Skipping {key} in composite resource: {result}")
+        return [result for result in results if not isinstance(result, Exception)]
+
+    async def _get_network_status(self) -> Dict[str, Any]:
+        status = await self._algod.status()
+        return {"network": self.config.network, "status": status}
+
+    async def _get_network_params(self) -> Dict[str, Any]:
+        params = await self._algod.suggested_params()
+        return {"network": self.config.network, "params": params}
+
+    async def _get_latest_block(self) -> Dict[str, Any]:
+        status = await self._algod.status()
+        block = await self._algod.block_info(status["last-round"])
+        return {"network": self.config.network, "round": status["last-round"], "block": block}
+
+    async def _get_popular_assets(self) -> Dict[str, Any]:
+        assets = await self._fan_out(self._algod.asset_info, self.config.popular_asset_ids)
+        return {"network": self.config.network, "assets": assets}
+
+    async def _get_popular_apps(self) -> Dict[str, Any]:
+        apps = await self._fan_out(self._algod.application_info, self.config.popular_app_ids)
+        return {"network": self.config.network, "applications": apps}
+
+    async def _get_daily_stats(self) -> Dict[str, Any]:
+        status = await self._algod.status()
+        last_round = status["last-round"]
+        first_round = max(1, last_round - DAILY_STATS_ROUNDS)
+        step = max(1, (last_round - first_round) // (DAILY_STATS_SAMPLES - 1))
+        rounds = list(range(last_round, first_round - 1, -step))[:DAILY_STATS_SAMPLES]
+        
+        async def sample(round_num):
+            block = (await self._algod.block_info(round_num))["block"]
+            return round_num, block.get("ts", 0), len(block.get("txns", []))
+        
+        samples = sorted(await self._fan_out(sample, rounds))
+        if not samples:
+            raise RuntimeError("No blocks could be sampled")
+        
+        round_span = samples[-1][0] - samples[0][0]
+        seconds = samples[-1][1] - samples[0][1]
+        avg_round_time = seconds / round_span if round_span and seconds > 0 else None
+        avg_txns = sum(txns for _, _, txns in samples) / len(samples)
+        rounds_per_day = 86400 / avg_round_time if avg_round_time else None
+        return {
+            "network": self.config.network,
+            "last_round": last_round,
+            "sampled_blocks": len(samples),
+            "avg_round_time_seconds": avg_round_time,
+            "avg_transactions_per_block": avg_txns,
+            "estimated_rounds_per_day": rounds_per_day,
+            "estimated_transactions_per_day": avg_txns * rounds_per_day if rounds_per_day else None,
+        }
+
+    async def _read_resource_payload(self, uri) -> Any:
+        """Fetch the raw payload for a single resource URI"""
+        key = str(uri)
+        reader = RESOURCE_READERS.get(key)
+        if reader is None:
+            raise ValueError(f"Unknown resource: {uri}")
+        
+        ttl = RESOURCE_TTLS.get(key)
+        if ttl is None:
+            return await getattr(self, reader)()
+        return await self._cached(key, ttl, getattr(self, reader))
+
+    async def read_many(self, uris: Sequence[AnyUrl]) -> List[ReadResourceResult]:
+        """Read several resources concurrently, keeping per-URI error handling"""
+        payloads = await asyncio.gather(
+            *(self._read_resource_payload(uri) for uri in uris),
+            return_exceptions=True
+        )
+        
+        results = []
+        for uri, payload in zip(uris, payloads):
+            if isinstance(payload, Exception):
+                logger.error(f"Error reading resource {uri}: {payload}")
+                text = _ERROR_TMPL.format(err=payload)
+            else:
+                # Resources are read by machines, so skip the indentation
+                text = _json(payload, indent=False)
+            results.append(ReadResourceResult(contents=[TextContent(type="text", text=text)]))
+        return results
+
+    async def _gather_bounded(self, fetch, keys: Sequence[Any], max_workers: int) -> Dict[str, Any]:
+        """Run fetch(key) for every key with at most max_workers in flight"""
+        sem = asyncio.Semaphore(max(1, max_workers))
+        # Repeated keys are fetched once
+        keys = list(dict.fromkeys(keys))
+        
+        async def one(key):
+            async with sem:
+                return await fetch(key)
+        
+        results = await asyncio.gather(*(one(key) for key in keys), return_exceptions=True)
+        # A failed lookup is reported per key instead of failing the whole batch
+        return {
+            str(key): {"error": str(result)} if isinstance(result, Exception) else result
+            for key, result in zip(keys, results)
+        }
+
+    async def _account_info_batch(self, addresses: List[str], max_workers: int) -> CallToolResult:
+        """Look up many accounts concurrently"""
+        result = await self._gather_bounded(self._algod.account_info, addresses, max_workers)
+        return CallToolResult(content=[TextContent(type="text", text=_json(result))])
+
+    async def _asset_info_batch(self, asset_ids: List[int], max_workers: int) -> CallToolResult:
+        """Look up many assets concurrently"""
+        result = await self._gather_bounded(self._algod.asset_info, asset_ids, max_workers)
+        return CallToolResult(content=[TextContent(type="text", text=_json(result))])
+
     def _register_handlers(self):
         """Register all MCP handlers"""
         
@@ -72,436 +733,19 @@ class AlgoUtils:
         @self.server.list_resources()
         async def handle_list_resources() -> ListResourcesResult:
             """List all available Algorand resources"""
-            return ListResourcesResult(
-                resources=[
-                    types.Resource(
-                        uri=AnyUrl("algorand://network/status"),
-                        name="Network Status",
-                        description="Current Algorand network status and health",
-                        mimeType="application/json",
-                    ),
-                    types.Resource(
-                        uri=AnyUrl("algorand://network/params"), 
-                        name="Network Parameters",
-                        description="Algorand network consensus parameters",
-                        mimeType="application/json",
-                    ),
-                    types.Resource(
-                        uri=AnyUrl("algorand://blocks/latest"),
-                        name="Latest Block",
-                        description="Information about the latest block",
-                        mimeType="application/json",
-                    ),
-                    types.Resource(
-                        uri=AnyUrl("algorand://assets/popular"),
-                        name="Popular Assets", 
-                        description="List of popular ASAs on Algorand",
-                        mimeType="application/json",
-                    ),
-                    types.Resource(
-                        uri=AnyUrl("algorand://apps/popular"),
-                        name="Popular Applications",
-                        description="List of popular dApps on Algorand", 
-                        mimeType="application/json",
-                    ),
-                    types.Resource(
-                        uri=AnyUrl("algorand://stats/daily"),
-                        name="Daily Statistics",
-                        description="Daily network statistics and metrics",
-                        mimeType="application/json",
-                    ),
-                ]
-            )
+            return self._resources_result
         
         @self.server.read_resource()
         async def handle_read_resource(uri: AnyUrl) -> ReadResourceResult:
             """Read resource content"""
-            try:
-                if str(uri) == "algorand://network/status":
-                    status = await self._get_network_status()
-                    return ReadResourceResult(
-                        contents=[
-                            TextContent(
-                                type="text",
-                                text=json.dumps(status, indent=2)
-                            )
-                        ]
-                    )
-                elif str(uri) == "algorand://network/params":
-                    params = await self._get_network_params()
-                    return ReadResourceResult(
-                        contents=[
-                            TextContent(
-                                type="text", 
-                                text=json.dumps(params, indent=2)
-                            )
-                        ]
-                    )
-                elif str(uri) == "algorand://blocks/latest":
-                    block = await self._get_latest_block()
-                    return ReadResourceResult(
-                        contents=[
-                            TextContent(
-                                type="text",
-                                text=json.dumps(block, indent=2)
-                            )
-                        ]
-                    )
-                elif str(uri) == "algorand://assets/popular":
-                    assets = await self._get_popular_assets()
-                    return ReadResourceResult(
-                        contents=[
-                            TextContent(
-                                type="text",
-                                text=json.dumps(assets, indent=2)
-                            )
-                        ]
-                    )
-                elif str(uri) == "algorand://apps/popular":
-                    apps = await self._get_popular_apps()
-                    return ReadResourceResult(
-                        contents=[
-                            TextContent(
-                                type="text",
-                                text=json.dumps(apps, indent=2)
-                            )
-                        ]
-                    )
-                elif str(uri) == "algorand://stats/daily":
-                    stats = await self._get_daily_stats()
-                    return ReadResourceResult(
-                        contents=[
-                            TextContent(
-                                type="text",
-                                text=json.dumps(stats, indent=2)
-                            )
-                        ]
-                    )
-                else:
-                    raise ValueError(f"Unknown resource: {uri}")
-                    
-            except Exception as e:
-                logger.error(f"Error reading resource {uri}: {e}")
-                return ReadResourceResult(
-                    contents=[
-                        TextContent(
-                            type="text", 
-                            text=f"Error: {str(e)}"
-                        )
-                    ]
-                )
+            results = await self.read_many([uri])
+            return results[0]
             
         @self.server.list_tools()
         async def handle_list_tools() -> ListToolsResult:
             """List all available tools"""
-            tools = [
-                # Account Management Tools
-                Tool(
-                    name="create_account",
-                    description="Generate a new Algorand account with mnemonic",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    },
-                ),
-                Tool(
-                    name="account_info",
-                    description="Get detailed account information",
-                    inputSchema={
-                        "type": "object", 
-                        "properties": {
-                            "address": {"type": "string", "description": "Account address"}
-                        },
-                        "required": ["address"]
-                    },
-                ),
-                Tool(
-                    name="account_balance",
-                    description="Get account ALGO balance",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "address": {"type": "string", "description": "Account address"}
-                        },
-                        "required": ["address"]
-                    },
-                ),
-                Tool(
-                    name="account_assets",
-                    description="List all assets held by an account", 
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "address": {"type": "string", "description": "Account address"}
-                        },
-                        "required": ["address"]
-                    },
-                ),
-                Tool(
-                    name="account_applications",
-                    description="List applications created or opted into by account",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "address": {"type": "string", "description": "Account address"}
-                        },
-                        "required": ["address"]
-                    },
-                ),
-                Tool(
-                    name="account_transactions",
-                    description="Get account transaction history",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "address": {"type": "string", "description": "Account address"},
-                            "limit": {"type": "integer", "description": "Number of transactions", "default": 50},
-                            "next_token": {"type": "string", "description": "Pagination token", "default": ""}
-                        },
-                        "required": ["address"]
-                    },
-                ),
-                # Transaction Tools
-                Tool(
-                    name="create_payment_txn",
-                    description="Create a payment transaction",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sender": {"type": "string", "description": "Sender address"},
-                            "receiver": {"type": "string", "description": "Receiver address"}, 
-                            "amount": {"type": "integer", "description": "Amount in microAlgos"},
-                            "note": {"type": "string", "description": "Transaction note", "default": ""}
-                        },
-                        "required": ["sender", "receiver", "amount"]
-                    },
-                ),
-                Tool(
-                    name="send_payment",
-                    description="Send ALGO payment (requires private key)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "private_key": {"type": "string", "description": "Sender private key"},
-                            "receiver": {"type": "string", "description": "Receiver address"},
-                            "amount": {"type": "integer", "description": "Amount in microAlgos"},
-                            "note": {"type": "string", "description": "Transaction note", "default": ""}
-                        },
-                        "required": ["private_key", "receiver", "amount"]
-                    },
-                ),
-                Tool(
-                    name="transaction_info",
-                    description="Get transaction details by ID",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "txid": {"type": "string", "description": "Transaction ID"}
-                        },
-                        "required": ["txid"]
-                    },
-                ),
-                Tool(
-                    name="pending_transactions",
-                    description="Get pending transactions from pool",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "max": {"type": "integer", "description": "Maximum transactions", "default": 10}
-                        },
-                        "required": []
-                    },
-                ),
-
-                # Asset Tools
-                Tool(
-                    name="create_asset",
-                    description="Create a new ASA (Algorand Standard Asset)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "private_key": {"type": "string", "description": "Creator private key"},
-                            "asset_name": {"type": "string", "description": "Asset name"},
-                            "unit_name": {"type": "string", "description": "Asset unit name"},
-                            "total": {"type": "integer", "description": "Total supply"},
-                            "decimals": {"type": "integer", "description": "Decimal places", "default": 0},
-                            "url": {"type": "string", "description": "Asset URL", "default": ""},
-                            "metadata_hash": {"type": "string", "description": "Metadata hash", "default": ""}
-                        },
-                        "required": ["private_key", "asset_name", "unit_name", "total"]
-                    },
-                ),
-                Tool(
-                    name="asset_info",
-                    description="Get asset information by ID",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "asset_id": {"type": "integer", "description": "Asset ID"}
-                        },
-                        "required": ["asset_id"]
-                    },
-                ),
-                Tool(
-                    name="asset_balances",
-                    description="Get all holders of an asset",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "asset_id": {"type": "integer", "description": "Asset ID"},
-                            "limit": {"type": "integer", "description": "Number of results", "default": 100}
-                        },
-                        "required": ["asset_id"]
-                    },
-                ),
-                Tool(
-                    name="opt_in_asset",
-                    description="Opt into an asset",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "private_key": {"type": "string", "description": "Account private key"},
-                            "asset_id": {"type": "integer", "description": "Asset ID"}
-                        },
-                        "required": ["private_key", "asset_id"]
-                    },
-                ),
-                Tool(
-                    name="transfer_asset",
-                    description="Transfer ASA tokens",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "private_key": {"type": "string", "description": "Sender private key"},
-                            "asset_id": {"type": "integer", "description": "Asset ID"},
-                            "receiver": {"type": "string", "description": "Receiver address"},
-                            "amount": {"type": "integer", "description": "Amount to transfer"}
-                        },
-                        "required": ["private_key", "asset_id", "receiver", "amount"]
-                    },
-                ),
-                Tool(
-                    name="application_state",
-                    description="Get application global state",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "app_id": {"type": "integer", "description": "Application ID"}
-                        },
-                        "required": ["app_id"]
-                    },
-                ),
-                Tool(
-                    name="account_app_state",
-                    description="Get account's local state for an application",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "address": {"type": "string", "description": "Account address"},
-                            "app_id": {"type": "integer", "description": "Application ID"}
-                        },
-                        "required": ["address", "app_id"]
-                    },
-                ),
-
-            Tool(
-                    name="validate_address",
-                    description="Validate an Algorand address",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "address": {"type": "string", "description": "Address to validate"}
-                        },
-                        "required": ["address"]
-                    },
-                ),
-                Tool(
-                    name="encode_address",
-                    description="Encode public key to address",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "public_key": {"type": "string", "description": "Base64 encoded public key"}
-                        },
-                        "required": ["public_key"]
-                    },
-                ),
-                Tool(
-                    name="decode_address", 
-                    description="Decode address to public key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "address": {"type": "string", "description": "Algorand address"}
-                        },
-                        "required": ["address"]
-                    },
-                ),
-                Tool(
-                    name="mnemonic_to_private_key",
-                    description="Convert mnemonic to private key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "mnemonic": {"type": "string", "description": "25-word mnemonic"}
-                        },
-                        "required": ["mnemonic"]
-                    },
-                ),
-                Tool(
-                    name="private_key_to_address",
-                    description="Get address from private key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "private_key": {"type": "string", "description": "Private key"}
-                        },
-                        "required": ["private_key"]
-                    },
-                ),
-
-                # Search Tools
-                Tool(
-                    name="search_transactions",
-                    description="Search transactions with filters",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "asset_id": {"type": "integer", "description": "Asset ID filter"},
-                            "address": {"type": "string", "description": "Address filter"},
-                            "tx_type": {"type": "string", "description": "Transaction type filter"},
-                            "limit": {"type": "integer", "description": "Number of results", "default": 50}
-                        },
-                        "required": []
-                    },
-                ),
-                Tool(
-                    name="search_assets",
-                    description="Search assets by name or creator",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string", "description": "Asset name filter"},
-                            "creator": {"type": "string", "description": "Creator address filter"},
-                            "limit": {"type": "integer", "description": "Number of results", "default": 50}
-                        },
-                        "required": []
-                    },
-                ),
-                Tool(
-                    name="search_applications",
-                    description="Search applications by creator",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "creator": {"type": "string", "description": "Creator address filter"},
-                            "limit": {"type": "integer", "description": "Number of results", "default": 50}
-                        },
-                        "required": []
-                    },
-                ),
-            ]
+            return self._tools_result
+        
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> CallToolResult:
             """Handle tool calls"""
@@ -606,23 +850,38 @@ class AlgoUtils:
                     return await self._search_applications(arguments)
                 elif name == "compile_teal":
                     return await self._compile_teal(arguments["source"])
+                elif name == "account_info_batch":
+                    return await self._account_info_batch(
+                        arguments["addresses"],
+                        arguments.get("max_workers", BATCH_MAX_WORKERS)
+                    )
+                elif name == "asset_info_batch":
+                    return await self._asset_info_batch(
+                        arguments["asset_ids"],
+                        arguments.get("max_workers", BATCH_MAX_WORKERS)
+                    )
                 else:
                     raise ValueError(f"Unknown tool: {name}")
                     
             except Exception as e:
                 logger.error(f"Error calling tool {name}: {e}")
                 return CallToolResult(
-                    content=[
-                        TextContent(
-                            type="text",
-                            text=f"Error: {str(e)}"
-                        )
-                    ],
+                    content=[TextContent(type="text", text=_ERROR_TMPL.format(err=e))],
                     isError=True
                 )
-            
-        
-if __name__ == "__main__":
-    algo_config = AlgorandConfig()
 
-    test_obj = AlgoUtils(algo_config)
\ No newline at end of file
+
+async def main():
+    async with AlgoUtils(AlgorandConfig()) as algo_utils:
+        await algo_utils.run()
+
+
+if __name__ == "__main__":
+    # uvloop's socket handling is much faster than the default selector loop;
+    # it isn't available on Windows, where the stock loop is kept
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
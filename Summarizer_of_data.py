@@ -1,49 +1,285 @@
 from langchain_ollama import OllamaLLM
 from langchain.prompts import PromptTemplate
+from langchain_text_splitters import RecursiveCharacterTextSplitter
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfgen import canvas
+from reportlab.lib.utils import simpleSplit
+import asyncio
+import hashlib
+import os
+import httpx
 import re
+import weakref
+from io import BytesIO
+from collections import OrderedDict
+from functools import lru_cache
+
+# Separator written between papers by the extraction script
+PAPER_SEPARATOR = b"=" * 50
+_TITLE_RE = re.compile(r"^[ \t]*Title:[ \t]*(.*?)\s*$", re.M)
+# Characters that aren't allowed in file names
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+# Page layout for summary PDFs, computed once rather than per document
+PDF_MARGIN = 50
+PDF_WIDTH, PDF_HEIGHT = letter
+PDF_TEXT_WIDTH = PDF_WIDTH - 2 * PDF_MARGIN
+PDF_TITLE_FONT = ("Helvetica-Bold", 14)
+PDF_BODY_FONT = ("Helvetica", 10)
+
+_PROMPT = PromptTemplate(
+    input_variables=["text"],
+    template="""
+    Summarize the following research paper content into concise bullet points:
+    {text}
+    Provide clear, concise, and comprehensive bullet points covering the main ideas, methods, results, and conclusions.
+    """
+)
+
+# A 1B instruct model at 4-bit is plenty for bullet-point summaries
+SUMMARY_MODEL = "llama3.2:1b-instruct-q4_0"
+MAX_CONTEXT = 4096
+# How long Ollama keeps the model loaded after a request, so idle gaps between
+# papers (or between app runs) don't pay the model load again
+KEEP_ALIVE = "30m"
+
+def _context_size(text):
+    """Sizes the context window to the input, rounded up to 512 so chains can be reused."""
+    needed = min(MAX_CONTEXT, len(text) // 2 + 512)
+    return -(-needed // 512) * 512
+
+def _new_llm():
+    return OllamaLLM(
+        model=SUMMARY_MODEL,
+        keep_alive=KEEP_ALIVE,
+        # Forwarded to the ollama httpx clients: keep connections pooled and multiplexed
+        client_kwargs={
+            "http2": True,
+            "limits": httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        },
+    )
+
+# One client for every synchronous summary; its pooled HTTP/2 connections are reused across papers
+_LLM = _new_llm()
+# The async client's pooled connections belong to the event loop that opened them, so every
+# asyncio.run() (a Streamlit rerun, a summarize_texts call) gets its own LLM for that loop
+_LOOP_LLMS = weakref.WeakKeyDictionary()
+
+def _loop_llm():
+    """Returns the LLM whose async client belongs to the running event loop."""
+    loop = asyncio.get_running_loop()
+    llm = _LOOP_LLMS.get(loop)
+    if llm is None:
+        llm = _LOOP_LLMS[loop] = _new_llm()
+    return llm
+
+def _chain_options(num_ctx):
+    return {"num_ctx": num_ctx, "num_predict": 512, "temperature": 0.2}
+
+@lru_cache(maxsize=16)
+def _summary_chain(num_ctx=MAX_CONTEXT):
+    """Returns the prompt | LLaMA chain for a context size, sharing the module-level client."""
+    return _PROMPT | _LLM.bind(options=_chain_options(num_ctx))
+
+def _asummary_chain(num_ctx=MAX_CONTEXT):
+    """Returns the prompt | LLaMA chain for a context size on the running loop's client."""
+    return _PROMPT | _loop_llm().bind(options=_chain_options(num_ctx))
+
+# Papers longer than this are summarized map-reduce style: each chunk first, then the
+# concatenated chunk summaries, so no single prompt carries the whole paper
+MAP_REDUCE_THRESHOLD = 8000
+_SPLITTER = RecursiveCharacterTextSplitter(chunk_size=2000, chunk_overlap=200)
+
+def _map_chunks(text):
+    """Returns the text to summarize: the paper itself, or its chunk summaries if it's long."""
+    if len(text) <= MAP_REDUCE_THRESHOLD:
+        return text
+    chunks = _SPLITTER.split_text(text)
+    chain = _summary_chain(num_ctx=_context_size(max(chunks, key=len)))
+    return "\n".join(chain.batch([{"text": chunk} for chunk in chunks]))
+
+async def _amap_chunks(text):
+    """Async variant of _map_chunks that summarizes the chunks concurrently."""
+    if len(text) <= MAP_REDUCE_THRESHOLD:
+        return text
+    chunks = _SPLITTER.split_text(text)
+    chain = _asummary_chain(num_ctx=_context_size(max(chunks, key=len)))
+    partials = await asyncio.gather(*(chain.ainvoke({"text": chunk}) for chunk in chunks))
+    return "\n".join(partials)
+
+def warm_up():
+    """Loads the summary model into Ollama ahead of the first paper."""
+    try:
+        _LLM.invoke("warmup", options={"num_predict": 1})
+    except Exception as e:
+        print(f"Error warming up the model: {e}")
+
+_BULLET_HEADER = "bullet points:"
+
+def format_bullets(summary):
+    """Normalizes the model output to one "* " bullet per non-empty line, in a single pass."""
+    summary = str(summary)
+    # Drop any preamble up to the "...bullet points:" header the model tends to echo
+    start = summary.lower().find(_BULLET_HEADER)
+    if start >= 0:
+        summary = summary[start + len(_BULLET_HEADER):]
+    return "\n".join(
+        f"* {line.strip().lstrip('*-• ')}" for line in summary.splitlines() if line.strip()
+    )
+
+# Summaries keyed by the md5 of the paper text, so reruns on the same paper skip the LLM
+SUMMARY_CACHE_SIZE = 128
+_summary_cache = OrderedDict()
+
+def _text_key(text):
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+def _cached_summary(key):
+    summary = _summary_cache.get(key)
+    if summary is not None:
+        _summary_cache.move_to_end(key)
+    return summary
+
+def _store_summary(key, summary):
+    _summary_cache[key] = summary
+    if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
 
 def summarize_text(text):
     """Summarizes extracted text into bullet points."""
-    prompt_template = PromptTemplate(
-        input_variables=["text"],
-        template="""
-        Summarize the following research paper content into concise bullet points:
-        {text}
-        Provide clear, concise, and comprehensive bullet points covering the main ideas, methods, results, and conclusions.
-        """
-    )
-    
-    # Initialize the LLaMA model
-    llm = OllamaLLM(model="llama2:latest")
-    chain = prompt_template | llm
+    key = _text_key(text)
+    cached = _cached_summary(key)
+    if cached is not None:
+        return cached
     
     try:
+        reduce_input = _map_chunks(text)
         # Invoke the chain to get the summary
-        summary = chain.invoke({"text": text})
-        return summary
+        chain = _summary_chain(num_ctx=_context_size(reduce_input))
+        summary = format_bullets(chain.invoke({"text": reduce_input}))
+    except Exception as e:
+        print(f"Error during summarization: {e}")
+        return "Summarization failed."
+    _store_summary(key, summary)
+    return summary
+
+async def asummarize_text(text):
+    """Async variant of summarize_text, so several papers can be in flight at once."""
+    key = _text_key(text)
+    cached = _cached_summary(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        reduce_input = await _amap_chunks(text)
+        chain = _asummary_chain(num_ctx=_context_size(reduce_input))
+        # Stream tokens as they are generated instead of waiting on one large response
+        chunks = [chunk async for chunk in chain.astream({"text": reduce_input})]
+        summary = format_bullets("".join(chunks))
     except Exception as e:
         print(f"Error during summarization: {e}")
         return "Summarization failed."
+    _store_summary(key, summary)
+    return summary
+
+def process_paper(paper_content):
+    """Returns (paper_title, summary) for one paper."""
+    return extract_paper_title(paper_content), summarize_text(paper_content)
+
+async def aprocess_paper(paper_content):
+    """Async variant of process_paper."""
+    return extract_paper_title(paper_content), await asummarize_text(paper_content)
+
+def stream_summary(text):
+    """Yields summary text as the model generates it; callers run format_bullets on the joined result."""
+    key = _text_key(text)
+    cached = _cached_summary(key)
+    if cached is not None:
+        yield cached
+        return
+    
+    chunks = []
+    try:
+        reduce_input = _map_chunks(text)
+        chain = _summary_chain(num_ctx=_context_size(reduce_input))
+        for chunk in chain.stream({"text": reduce_input}):
+            chunks.append(chunk)
+            yield chunk
+    except Exception as e:
+        print(f"Error during summarization: {e}")
+        # Mark the partial text as incomplete; failures are never cached
+        yield "\n\nSummarization failed."
+        return
+    _store_summary(key, format_bullets("".join(chunks)))
+
+# Ollama requests in flight at once when summarizing several papers
+MAX_CONCURRENT_SUMMARIES = 4
+
+async def summarize_as_completed(paper_contents, max_concurrency=MAX_CONCURRENT_SUMMARIES):
+    """Summarizes papers concurrently, yielding (index, paper_title, summary) as each one finishes."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def one(index, paper_content):
+        async with semaphore:
+            return (index, *await aprocess_paper(paper_content))
+    
+    for done in asyncio.as_completed([one(i, paper) for i, paper in enumerate(paper_contents)]):
+        yield await done
+
+def summarize_texts(texts, max_concurrency=MAX_CONCURRENT_SUMMARIES):
+    """Summarizes a list of texts in one call, returning summaries in input order."""
+    async def collect():
+        summaries = [None] * len(texts)
+        async for index, _, summary in summarize_as_completed(texts, max_concurrency):
+            summaries[index] = summary
+        return summaries
+    
+    return asyncio.run(collect())
+
+async def summarize_papers(paper_contents, max_concurrency=MAX_CONCURRENT_SUMMARIES):
+    """Summarizes papers concurrently and renders each summary to an in-memory PDF.
+
+    Returns a list of (paper_title, summary, pdf_filename, pdf_bytes) tuples in input order.
+    """
+    loop = asyncio.get_running_loop()
+    pending = []
+    
+    async for index, paper_title, summary in summarize_as_completed(paper_contents, max_concurrency):
+        # reportlab is blocking, so build the PDF off the event loop
+        render = loop.run_in_executor(None, render_pdf, summary, paper_title)
+        pending.append((index, paper_title, summary, render))
+    
+    results = [None] * len(paper_contents)
+    for index, paper_title, summary, render in pending:
+        pdf_filename, pdf_bytes = await render
+        results[index] = (paper_title, summary, pdf_filename, pdf_bytes)
+    return results
+
+def iter_papers(file_path, chunk_size=65536):
+    """Yields each paper section of the saved content file, reading it a chunk at a time."""
+    with open(file_path, "rb") as file:
+        buffer = bytearray()
+        start = 0  # Everything before this offset has already been searched
+        first = True  # Text before the first separator isn't a paper
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            buffer += chunk
+            while (index := buffer.find(PAPER_SEPARATOR, start)) != -1:
+                paper = bytes(buffer[:index]).strip()
+                del buffer[:index + len(PAPER_SEPARATOR)]
+                start = 0
+                if not first and paper:
+                    yield paper.decode("utf-8")
+                first = False
+            # Only the tail can hold the start of a separator split across reads
+            start = max(0, len(buffer) - len(PAPER_SEPARATOR) + 1)
+        
+        paper = bytes(buffer).strip()
+        if not first and paper:
+            yield paper.decode("utf-8")
 
 def extract_text_from_file(file_path):
     """Extracts text from the saved paper content file and separates it by paper."""
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            content = file.read()
-        
-        # Split the content by the separator used in the previous script
-        papers = content.split("="*50)[1:]  # Skip the first empty split if any
-        paper_contents = []
-        
-        for paper in papers:
-            paper = paper.strip()
-            if paper:  # Only process non-empty sections
-                paper_contents.append(paper)
-        
-        return paper_contents  # List of individual paper contents
+        return list(iter_papers(file_path))  # List of individual paper contents
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found.")
         return []
@@ -54,43 +290,64 @@ def extract_text_from_file(file_path):
         print(f"Unexpected error while reading file: {e}")
         return []
 
+@lru_cache(maxsize=256)
 def extract_paper_title(paper_content):
     """Extracts the paper title from the content using the 'Title:' pattern."""
-    lines = paper_content.splitlines()
-    for line in lines:
-        line = line.strip()
-        if line.startswith("Title:"):
-            # Extract everything after "Title:" and strip whitespace
-            return line.replace("Title:", "").strip()
+    match = _TITLE_RE.search(paper_content)
+    if match:
+        return match.group(1)
     return "Untitled_Paper"  # Default if no title found
 
-def save_to_pdf(summary, paper_title, output_dir="summaries"):
-    """Saves the summary to a PDF file with the paper title as the filename."""
-    import os
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
+def _pdf_filename(paper_title):
     # Sanitize the paper title to make it a valid filename
-    sanitized_title = re.sub(r'[<>:"/\\|?*]', '', paper_title)
-    pdf_filename = f"{output_dir}/{sanitized_title}.pdf"
-    
-    # Create PDF
-    doc = SimpleDocTemplate(pdf_filename, pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
+    return f"{_SANITIZE_RE.sub('', paper_title)}.pdf"
+
+def _draw_pdf(target, summary, paper_title):
+    """Draws the summary PDF onto target, a path or a binary file object."""
+    # Draw straight onto a canvas; plain bullet text doesn't need the platypus layout engine
+    pdf = canvas.Canvas(target, pagesize=letter)
+    y = PDF_HEIGHT - PDF_MARGIN
     
     # Add title to PDF
-    story.append(Paragraph(f"Summary of: {paper_title}", styles['Title']))
-    story.append(Paragraph("<br/>", styles['Normal']))  # Spacer
+    pdf.setFont(*PDF_TITLE_FONT)
+    for line in simpleSplit(f"Summary of: {paper_title}", *PDF_TITLE_FONT, PDF_TEXT_WIDTH):
+        pdf.drawString(PDF_MARGIN, y, line)
+        y -= 18
+    y -= 12  # Spacer
+    
+    # Emit the body as one text object per page rather than a drawString per line,
+    # wrapping each summary line to the page width and starting a new page on overflow
+    text = pdf.beginText(PDF_MARGIN, y)
+    text.setFont(*PDF_BODY_FONT, leading=13)
+    for paragraph in summary.splitlines():
+        if not paragraph.strip():
+            continue
+        for line in simpleSplit(paragraph, *PDF_BODY_FONT, PDF_TEXT_WIDTH):
+            if text.getY() < PDF_MARGIN:
+                pdf.drawText(text)
+                pdf.showPage()
+                text = pdf.beginText(PDF_MARGIN, PDF_HEIGHT - PDF_MARGIN)
+                text.setFont(*PDF_BODY_FONT, leading=13)
+            text.textLine(line)
+        text.setTextOrigin(PDF_MARGIN, text.getY() - 4)
+    pdf.drawText(text)
     
-    # Split summary into lines and add as paragraphs
-    for line in summary.splitlines():
-        if line.strip():
-            story.append(Paragraph(line, styles['BodyText']))
+    pdf.save()
+
+def render_pdf(summary, paper_title):
+    """Renders the summary PDF in memory, returning (filename, pdf_bytes)."""
+    buffer = BytesIO()
+    _draw_pdf(buffer, summary, paper_title)
+    return _pdf_filename(paper_title), buffer.getvalue()
+
+def save_to_pdf(summary, paper_title, output_dir="summaries"):
+    """Saves the summary to a PDF file with the paper title as the filename."""
+    os.makedirs(output_dir, exist_ok=True)
+    pdf_filename = f"{output_dir}/{_pdf_filename(paper_title)}"
     
-    # Build the PDF
+    # Write the PDF
     try:
-        doc.build(story)
+        _draw_pdf(pdf_filename, summary, paper_title)
         print(f"Saved summary to {pdf_filename}")
     except Exception as e:
-        print(f"Error saving PDF {pdf_filename}: {e}")
\ No newline at end of file
+        print(f"Error saving PDF {pdf_filename}: {e}")
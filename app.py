@@ -1,11 +1,15 @@
 import streamlit as st
+import asyncio
+import threading
 import time
 import os
-import shutil
 from datetime import datetime
 from arc19 import ARC19
 from Extract_paper_data import fetch_paper
-from Summarizer_of_data import extract_text_from_file, save_to_pdf, extract_paper_title, summarize_text
+from Summarizer_of_data import (
+    extract_text_from_file, render_pdf, extract_paper_title, summarize_as_completed,
+    format_bullets, stream_summary, warm_up
+)
 
 # Page configuration
 st.set_page_config(
@@ -54,6 +58,15 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def warm_up_model():
+    """Load the Ollama model in the background once per server process"""
+    thread = threading.Thread(target=warm_up, daemon=True)
+    thread.start()
+    return thread
+
+warm_up_model()
+
 def display_status(step_name, status, content=""):
     """Display status with appropriate styling"""
     status_class = f"status-{status}"
@@ -104,7 +117,6 @@ def run_research_agent(research_query, max_results=1):
     try:
         # File paths
         save_file_path = "research_content.txt"
-        pdf_summary_directory = "summaries"
         
         # Step 1: Fetching papers
         with step1_placeholder:
@@ -142,35 +154,45 @@ def run_research_agent(research_query, max_results=1):
         with results_container:
             st.subheader("📋 Paper Summaries")
         
-        summaries_created = 0
+        # Summary PDFs stay in memory, keyed by filename, until they're uploaded to IPFS
+        pdfs = {}
         
-        for i, paper_content in enumerate(paper_contents, 1):
-            # Extract paper title
-            paper_title = extract_paper_title(paper_content)
-            
-            # Display paper being processed
-            with results_container:
-                st.markdown(f"**Processing Paper {i}: {paper_title}**")
+        async def summarize_with_updates():
+            """Render each summary as soon as its paper finishes"""
+            async for _, paper_title, summary in summarize_as_completed(paper_contents):
                 
-                with st.spinner(f"Summarizing paper {i}..."):
-                    # Summarize the content
-                    summary = summarize_text(paper_content)
-                
-                # Display the summary
-                st.markdown(f"""
-                <div class="paper-summary">
-                    <h4>📄 {paper_title}</h4>
-                    <p><strong>Summary:</strong></p>
-                    <p>{summary}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                with results_container:
+                    # Display the summary
+                    st.markdown(f"""
+                    <div class="paper-summary">
+                        <h4>📄 {paper_title}</h4>
+                        <p><strong>Summary:</strong></p>
+                        <p>{summary}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
                 
-                # Save summary to PDF
-                save_to_pdf(summary, paper_title, output_dir=pdf_summary_directory)
-                summaries_created += 1
+                # Render summary to PDF
+                pdf_filename, pdf_bytes = render_pdf(summary, paper_title)
+                pdfs[pdf_filename] = pdf_bytes
+        
+        if len(paper_contents) == 1:
+            # A single paper gains nothing from concurrency, so stream its tokens as they arrive
+            paper_content = paper_contents[0]
+            paper_title = extract_paper_title(paper_content)
+            with results_container:
+                st.markdown(f"**📄 {paper_title}**")
+                # Cached summaries are already formatted and format_bullets leaves them unchanged
+                summary = format_bullets(st.write_stream(stream_summary(paper_content)))
+            pdf_filename, pdf_bytes = render_pdf(summary, paper_title)
+            pdfs[pdf_filename] = pdf_bytes
+        else:
+            # Summarize all papers concurrently instead of one Ollama call at a time
+            with results_container:
+                with st.spinner(f"Summarizing {len(paper_contents)} paper(s)..."):
+                    asyncio.run(summarize_with_updates())
         
         with step3_placeholder:
-            display_status("Analyzing and Summarizing Papers", "completed", f"Created {summaries_created} summary PDF(s)")
+            display_status("Analyzing and Summarizing Papers", "completed", f"Created {len(pdfs)} summary PDF(s)")
         
         # Step 4: Uploading to IPFS
         with step4_placeholder:
@@ -178,14 +200,15 @@ def run_research_agent(research_query, max_results=1):
         progress_bar.progress(60)
         progress_text.text("🌐 Uploading files to IPFS...")
         
-        # Get all files in summaries directory
-        research_paper_file_names = [
-            os.path.join(pdf_summary_directory, filename) 
-            for filename in os.listdir(pdf_summary_directory)
-        ]
+        # One ARC19 client for the whole run: the algod clients and suggested params are reused
+        arc_obj = ARC19()
+        
+        # Upload all summaries to IPFS concurrently
+        research_paper_file_names = list(pdfs)
+        cids = asyncio.run(arc_obj.upload_all_bytes(pdfs.items()))
         
         with step4_placeholder:
-            display_status("Uploading to IPFS", "completed", f"Uploaded {len(research_paper_file_names)} file(s) to IPFS")
+            display_status("Uploading to IPFS", "completed", f"Uploaded {sum(1 for cid in cids if cid)} file(s) to IPFS")
         
         # Step 5: Creating ARC19 assets
         with step5_placeholder:
@@ -195,12 +218,8 @@ def run_research_agent(research_query, max_results=1):
         
         transaction_links = []
         
-        for filename in research_paper_file_names:
-            arc_obj = ARC19()
-            
-            # Upload metadata and get CID
-            cid = arc_obj.upload_metadata(file_path=filename)
-            
+        assets = []
+        for filename, cid in zip(research_paper_file_names, cids):
             if cid:
                 name = filename
                 desc = "Research paper summary"
@@ -216,16 +235,13 @@ def run_research_agent(research_query, max_results=1):
                 reserve_address = arc_obj.reserve_address_from_cid(cid=cid)
                 url = arc_obj.create_url_from_cid(cid=cid)
                 
-                # Create asset
-                transaction_id = arc_obj.create_asset(
-                    metadata_hash=metadata_hash,
-                    reserve_address=reserve_address,
-                    url=url
-                )
-                
-                transaction_links.append(
-                    f"https://lora.algokit.io/localnet/transaction/{transaction_id}"
-                )
+                assets.append((metadata_hash, reserve_address, url))
+        
+        # Sign and submit every asset together, then wait for their confirmations
+        for transaction_id in arc_obj.create_assets(assets):
+            transaction_links.append(
+                f"https://lora.algokit.io/localnet/transaction/{transaction_id}"
+            )
         
         with step5_placeholder:
             display_status("Creating ARC19 Assets", "completed", f"Created {len(transaction_links)} blockchain asset(s)")
@@ -236,10 +252,6 @@ def run_research_agent(research_query, max_results=1):
         progress_bar.progress(95)
         progress_text.text("🧹 Cleaning up temporary files...")
         
-        # Remove temporary directory
-        if os.path.exists(pdf_summary_directory):
-            shutil.rmtree(pdf_summary_directory)
-        
         # Remove temporary text file
         if os.path.exists(save_file_path):
             os.remove(save_file_path)
@@ -1,12 +1,24 @@
+import asyncio
 import hashlib
 import json
+import logging
 import os
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 from algosdk import mnemonic,account,transaction,encoding
 import algokit_utils
 import re
+import sqlite3
+import ssl
+import threading
+import time
+from collections import namedtuple
+from functools import lru_cache, partial
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
 from multiformats_cid import make_cid
 import multihash
 from dotenv import load_dotenv
@@ -14,8 +26,107 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+_TEMPLATE_IPFS_RE = re.compile(
+    r"template-ipfs://{ipfscid:(?P<version>[01]):(?P<codec>[a-z0-9\-]+):(?P<field>[a-z0-9\-]+):(?P<hash>[a-z0-9\-]+)}"
+)
+
+PINATA_PIN_FILE_URL = "https://api.pinata.cloud/pinning/pinFileToIPFS"
+
+# IPFS hashes of content already pinned, keyed by the sha256 of the bytes.
+# Pinning is content addressed, so identical bytes always come back with the same CID.
+# _pinned_cids holds this process's lookups; PINATA_CACHE_DB persists them across runs
+PINATA_CACHE_DB = "pinata_cache.db"
+_pinned_cids = {}
+_pin_db = None
+_pin_db_lock = threading.Lock()
+
+# Pin uploads that hit a rate limit or a transient server error are retried this many
+# times, rebuilding the request body for each attempt
+PIN_RETRIES = 3
+PIN_BACKOFF = 0.3
+_PIN_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Bound on one async pin attempt, instead of aiohttp's five-minute session default
+PIN_TIMEOUT = aiohttp.ClientTimeout(total=60 , sock_connect=10)
+
+# Algorand's limit on transactions in one atomic group
+MAX_GROUP_SIZE = 16
+
+# Suggested params stay valid for ~1000 rounds; refresh once half of that has passed.
+# The current round is only checked every SUGGESTED_PARAMS_TTL seconds
+SUGGESTED_PARAMS_MAX_AGE_ROUNDS = 500
+SUGGESTED_PARAMS_TTL = 30
+
+
+# hashlib should resolve to OpenSSL's implementations, whose assembly paths use the
+# CPU's SHA extensions; the builtin fallbacks are several times slower
+if hashlib.sha256.__name__ != "openssl_sha256" or hashlib.sha512.__name__ != "openssl_sha512":
+    logger.warning("hashlib is not backed by OpenSSL; SHA digests will be slow")
+else:
+    logger.info(f"hashlib backed by {ssl.OPENSSL_VERSION}")
+
+def _file_sha256(file):
+    # file_digest runs the whole read/update loop in C; fall back to a buffered loop on Python < 3.11
+    if hasattr(hashlib , "file_digest"):
+        return hashlib.file_digest(file , "sha256").digest()
+    digest = hashlib.sha256()
+    buffer = bytearray(1 << 16)
+    view = memoryview(buffer)
+    while size := file.readinto(buffer):
+        digest.update(view[:size])
+    return digest.digest()
+
+
+def _pin_cache():
+    global _pin_db
+    if _pin_db is None:
+        _pin_db = sqlite3.connect(PINATA_CACHE_DB , check_same_thread=False)
+        _pin_db.execute("CREATE TABLE IF NOT EXISTS pinned (sha256 BLOB PRIMARY KEY, cid TEXT)")
+    return _pin_db
+
+
+def _cached_cid(digest):
+    # Memory first, then the on-disk cache from earlier runs
+    if digest in _pinned_cids:
+        return _pinned_cids[digest]
+    with _pin_db_lock:
+        row = _pin_cache().execute("SELECT cid FROM pinned WHERE sha256 = ?" , (digest ,)).fetchone()
+    if row is None:
+        return None
+    _pinned_cids[digest] = row[0]
+    return row[0]
+
+
+def _remember_cid(digest , cid):
+    if not cid:
+        return cid
+    _pinned_cids[digest] = cid
+    with _pin_db_lock:
+        with _pin_cache() as db:
+            db.execute("INSERT OR REPLACE INTO pinned (sha256 , cid) VALUES (? , ?)" , (digest , cid))
+    return cid
+
+
+CidInfo = namedtuple("CidInfo" , ["version" , "codec" , "hash_name" , "reserve_address"])
+
+
+@lru_cache(maxsize=1024)
+def _decode_cid(cid):
+    # Parse the CID once; every ARC19 field derived from it comes from this result
+    parsed_cid = make_cid(cid)
+    decoded_hash = multihash.decode(parsed_cid.multihash)
+    reserve_address = encoding.encode_address(decoded_hash.digest)
+    # encode_address just built it, so a length check is enough; is_valid_address would
+    # base32-decode it again and recompute the checksum
+    assert len(reserve_address) == 58 and reserve_address.isascii()
+    return CidInfo(parsed_cid.version , parsed_cid.codec , decoded_hash.name , reserve_address)
+
 
 class ARC19:
+    # LocalNet default account, shared by every instance once fetched from KMD
+    _account = None
+
     def __init__(self):
         
         
@@ -27,66 +138,205 @@ class ARC19:
         self.algod_indexer = IndexerClient(indexer_token=self.algod_token , indexer_address=self.indexer_address)
 
         # User account
-        self.user_account = algokit_utils.get_localnet_default_account(client=self.algod_client)
+        self.user_account = self.load_account(self.algod_client)
         self.private_key = self.user_account.private_key
         self.user_address = self.user_account.address
 
         # Pinata
         self.pinata_key = os.environ['IPFS_API_KEY']
         self.pinata_secret_key = os.environ['IPFS_SECRET_KEY']  
+        # Keep-alive session so repeated uploads reuse one TLS connection to Pinata.
+        # urllib3 only retries idempotent methods here; the pin POSTs retry in _post_pin,
+        # which can rebuild their bodies
+        self._session = requests.Session()
+        self._session.headers.update(self._pinata_headers())
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retries))
 
-        # Suggested params
-        self.sp = self.algod_client.suggested_params()
+        # Every ARC19 NFT shares these creation fields; sp is left out since it refreshes by round
+        self._mk_txn = partial(
+            transaction.AssetCreateTxn,
+            sender=self.user_address,
+            total=1, # Non divisible NFT
+            decimals=0 ,# Non divisible NFT
+            default_frozen=False,
+            asset_name="ARC19",
+            unit_name="ARC19NFT",
+            manager=self.user_address,
+            clawback=self.user_address
+        )
 
+        # Suggested params, fetched lazily and reused until their round is stale
+        self._sp = None
+        self._sp_fetched_round = 0
+        self._sp_checked_at = 0.0
 
-    def upload_metadata(self , file_path):
+    @classmethod
+    def load_account(cls , algod_client):
         '''
-        This will upload the digital assets to IPFS
-        Returns the IPFS hash which will be used to convert to reserve address
+        Looking up the LocalNet default account walks the KMD wallets and exports the key,
+        so do it once per process and memoize the result on the class
         '''
-        url = "https://api.pinata.cloud/pinning/pinFileToIPFS"
-        headers = {
+        if cls._account is None:
+            cls._account = algokit_utils.get_localnet_default_account(client=algod_client)
+        return cls._account
+
+    @property
+    def sp(self):
+        if self._sp is not None and time.monotonic() - self._sp_checked_at <= SUGGESTED_PARAMS_TTL:
+            return self._sp
+
+        if self._sp is not None:
+            last_round = self.algod_client.status()["last-round"]
+            if last_round - self._sp_fetched_round < SUGGESTED_PARAMS_MAX_AGE_ROUNDS:
+                self._sp_checked_at = time.monotonic()
+                return self._sp
+
+        self._sp = self.algod_client.suggested_params()
+        self._sp_fetched_round = self._sp.first
+        self._sp_checked_at = time.monotonic()
+        return self._sp
+
+    def _pinata_headers(self):
+        return {
             "pinata_api_key": self.pinata_key,
             "pinata_secret_api_key": self.pinata_secret_key,
         }
+
+    def _post_pin(self , build_request):
+        '''
+        POST to pinFileToIPFS, retrying 429/5xx with backoff
+        build_request returns fresh requests.post kwargs for each attempt, since a streamed
+        body is consumed by the first send and can't be rewound
+        '''
+        for attempt in range(PIN_RETRIES + 1):
+            response = self._session.post(url=PINATA_PIN_FILE_URL , **build_request())
+            if response.status_code not in _PIN_RETRY_STATUSES or attempt == PIN_RETRIES:
+                return response
+            time.sleep(PIN_BACKOFF * 2 ** attempt)
+
+    def upload_metadata(self , file_path):
+        '''
+        This will upload the digital assets to IPFS
+        Returns the IPFS hash which will be used to convert to reserve address
+        '''
         filename = os.path.basename(file_path)
         with open(file_path , 'rb') as file:
 
-            files = {"file" :(filename , file)}
-            response = requests.post(url=url , files=files , headers=headers)
-            if response.status_code == 200:
-                ipfs_hash = response.json().get("IpfsHash")
+            # Hash the file locally first so content that's already pinned skips the upload
+            digest = _file_sha256(file)
+            if ipfs_hash := _cached_cid(digest):
                 return ipfs_hash
+
+            def build_request():
+                # Stream the multipart body from disk instead of building it in memory;
+                # every attempt gets a new encoder over the rewound file
+                file.seek(0)
+                encoder = MultipartEncoder(fields={"file" :(filename , file , "application/octet-stream")})
+                return {"data" : encoder , "headers" : {"Content-Type" : encoder.content_type}}
+
+            response = self._post_pin(build_request)
+            if response.status_code == 200:
+                return _remember_cid(digest , response.json().get("IpfsHash"))
             
             else:
                 print("Failed to upload file :-" , response.status_code , response.text)
                 return None
+
+    def upload_metadata_bytes(self , filename , data):
+        '''
+        Upload an in-memory file to IPFS
+        Returns the IPFS hash, or None if the upload failed
+        '''
+        digest = hashlib.sha256(data).digest()
+        if ipfs_hash := _cached_cid(digest):
+            return ipfs_hash
+
+        response = self._post_pin(lambda: {"files" : {"file" :(filename , data)}})
+        if response.status_code == 200:
+            return _remember_cid(digest , response.json().get("IpfsHash"))
+
+        print("Failed to upload file :-" , response.status_code , response.text)
+        return None
+
+    async def aupload_metadata(self , session , file_path):
+        '''
+        Async variant of upload_metadata over a shared aiohttp session
+        Returns the IPFS hash, or None if the upload failed
+        '''
+        with open(file_path , 'rb') as file:
+            data = file.read()
+        return await self.aupload_metadata_bytes(session , os.path.basename(file_path) , data)
+
+    async def aupload_metadata_bytes(self , session , filename , data):
+        '''
+        Async variant of upload_metadata_bytes over a shared aiohttp session
+        '''
+        digest = hashlib.sha256(data).digest()
+        if ipfs_hash := _cached_cid(digest):
+            return ipfs_hash
+
+        for attempt in range(PIN_RETRIES + 1):
+            # A FormData body can only be sent once, so every attempt builds its own
+            form = aiohttp.FormData()
+            form.add_field("file" , data , filename=filename)
+            async with session.post(PINATA_PIN_FILE_URL , data=form , headers=self._pinata_headers() ,
+                                    timeout=PIN_TIMEOUT) as response:
+                if response.status == 200:
+                    return _remember_cid(digest , (await response.json()).get("IpfsHash"))
+
+                if response.status not in _PIN_RETRY_STATUSES or attempt == PIN_RETRIES:
+                    print("Failed to upload file :-" , response.status , await response.text())
+                    return None
+            await asyncio.sleep(PIN_BACKOFF * 2 ** attempt)
+
+    async def upload_all(self , file_paths):
+        '''
+        Upload every file to IPFS concurrently
+        Returns the IPFS hashes in the same order as file_paths
+        '''
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(*(self.aupload_metadata(session , path) for path in file_paths))
+
+    async def upload_all_bytes(self , files):
+        '''
+        Upload in-memory files, given as (filename , data) pairs, to IPFS concurrently
+        Returns the IPFS hashes in the same order as files
+        '''
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(
+                *(self.aupload_metadata_bytes(session , filename , data) for filename , data in files)
+            )
             
-    def reserve_address_from_cid(self,cid):
-        decoded_cid = multihash.decode(make_cid(cid).multihash)
-        reserve_address = encoding.encode_address(decoded_cid.digest)
-        assert encoding.is_valid_address(reserve_address)
-        return reserve_address
+    # A pure function of the CID, memoized so repeat CIDs (duplicate content, retries) are one dict hit
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def reserve_address_from_cid(cid):
+        return _decode_cid(cid).reserve_address
         
     def version_from_cid(self,cid):
-        return make_cid(cid).version
+        return _decode_cid(cid).version
 
     def codec_from_cid(self,cid):
-        return make_cid(cid).codec
+        return _decode_cid(cid).codec
 
     def hash_from_cid(self,cid):
-        return multihash.decode(make_cid(cid).multihash).name
+        return _decode_cid(cid).hash_name
 
 
-    def create_url_from_cid(self,cid):
-        version = self.version_from_cid(cid)
-        codec = self.codec_from_cid(cid)
-        hash = self.hash_from_cid(cid)
-        url = "template-ipfs://{ipfscid:" + f"{version}:{codec}:reserve:{hash}" + "}"
-        valid = re.compile(
-            r"template-ipfs://{ipfscid:(?P<version>[01]):(?P<codec>[a-z0-9\-]+):(?P<field>[a-z0-9\-]+):(?P<hash>[a-z0-9\-]+)}"
-        )
-        assert bool(valid.match(url))
+    # Memoized like reserve_address_from_cid
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def create_url_from_cid(cid):
+        cid_info = _decode_cid(cid)
+        url = "template-ipfs://{ipfscid:" + f"{cid_info.version}:{cid_info.codec}:reserve:{cid_info.hash_name}" + "}"
+        # Sanity check only; skipped entirely under python -O
+        if __debug__:
+            assert _TEMPLATE_IPFS_RE.match(url) , url
         return url
 
 
@@ -102,37 +352,50 @@ class ARC19:
         }
 
         print(f"NFT URL :- https://indigo-central-dragonfly-340.mypinata.cloud/ipfs/{ipfs_hash}")
-        metadata_text = json.dumps(metadata , separators=(",",":"))
+        # Keep the stdlib encoding (ensure_ascii escapes) so hashes match assets minted before
+        metadata_bytes = json.dumps(metadata , separators=(",",":")).encode()
         
-        metadata_hash = hashlib.sha256(metadata_text.encode()).digest()
+        metadata_hash = hashlib.sha256(metadata_bytes).digest()
 
         return metadata_hash
     
     
-    def create_asset(self , metadata_hash , reserve_address , url):
+    def build_create_asset_txn(self , metadata_hash , reserve_address , url):
 
-        usigned_txn = transaction.AssetCreateTxn(
-            sender=self.user_address,
+        return self._mk_txn(
             sp=self.sp,
-            total=1, # Non divisible NFT
-            decimals=0 ,# Non divisible NFT
-            default_frozen=False,
-            asset_name="ARC19",
-            unit_name="ARC19NFT",
-            manager=self.user_address,
-            clawback=self.user_address,
             reserve=reserve_address,
             url=url,
             metadata_hash=metadata_hash
         )
 
-        signed_txn = usigned_txn.sign(self.private_key)
-        tx_id = self.algod_client.send_transaction(signed_txn)
-        transaction.wait_for_confirmation(algod_client=self.algod_client , txid=tx_id)
-
-        
+    def submit_group(self , txns):
+        '''
+        Sign txns as one atomic group (at most 16) and send them in a single request
+        Returns the txids; wait on the last one, the whole group confirms in the same round
+        '''
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        signed_txns = [txn.sign(self.private_key) for txn in txns]
+        self.algod_client.send_transactions(signed_txns)
+        return [signed_txn.get_txid() for signed_txn in signed_txns]
 
+    def create_asset(self , metadata_hash , reserve_address , url):
+        tx_id = self.submit_group([self.build_create_asset_txn(metadata_hash , reserve_address , url)])[0]
+        transaction.wait_for_confirmation(algod_client=self.algod_client , txid=tx_id)
         return tx_id
 
-
-
+    def create_assets(self , assets):
+        '''
+        Create several ARC19 assets at once
+        assets is a list of (metadata_hash , reserve_address , url) tuples; returns their txids in order
+        '''
+        txns = [self.build_create_asset_txn(*asset) for asset in assets]
+        # Submit every group first, then wait once per group instead of a block time per asset
+        groups = [
+            self.submit_group(txns[start:start + MAX_GROUP_SIZE])
+            for start in range(0 , len(txns) , MAX_GROUP_SIZE)
+        ]
+        for tx_ids in groups:
+            transaction.wait_for_confirmation(algod_client=self.algod_client , txid=tx_ids[-1])
+        return [tx_id for tx_ids in groups for tx_id in tx_ids]
@@ -1,77 +1,104 @@
 from arc19 import ARC19
-from Extract_paper_data import fetch_paper
-from Summarizer_of_data import extract_text_from_file , save_to_pdf , extract_paper_title , summarize_text
-import os
-import shutil
-
-if __name__ == "__main__":
-    
-
-    save_file_path = "research_content.txt"
-    pdf_summary_directory = "summaries"
-
-    research_about = "Latest blockchain research"
-
-    fetch_paper(query=research_about , max_results=1, save_file=save_file_path)
-    paper_contents = extract_text_from_file(save_file_path)
-
-
-    if paper_contents:
-        # Process and summarize each paper individually
-        for i, paper_content in enumerate(paper_contents, 1):
-            print(f"\n{'*'*50}")
-            print(f"Processing Paper {i}:")
-            print(f"{'*'*50}")
-            
-            # Extract paper title
-            paper_title = extract_paper_title(paper_content)
-            print(f"Paper Title: {paper_title}")
-            
-            # Summarize the content of this paper
-            summary = summarize_text(paper_content)
-            print(summary)
-            print(f"{'*'*50}\n")
-            
-            # Save summary to PDF
-            save_to_pdf(summary, paper_title ,output_dir=pdf_summary_directory)
-    
-
-    # Get all files inside summaries directory
-    research_paper_file_names = [os.path.join(pdf_summary_directory , filename) for filename in os.listdir(pdf_summary_directory)]
-
-    for filename in research_paper_file_names:
-
-        arc_obj = ARC19()
-        # CID is basically the IPFS file hash 
-        cid = arc_obj.upload_metadata(file_path=filename)
-
-        if cid:
-            name = filename
-            desc = "Research paper"
-
+from Extract_paper_data import iter_fetched_papers
+from Summarizer_of_data import aprocess_paper , render_pdf , MAX_CONCURRENT_SUMMARIES
+import aiohttp
+import asyncio
+
+# Pinata uploads in flight at once
+MAX_CONCURRENT_UPLOADS = 8
+
+
+async def run_pipeline(research_about , max_results=1):
+    '''
+    Fetch, summarize and upload papers as a streaming pipeline: paper k can be
+    summarizing while paper k+1 downloads and paper k-1 uploads to IPFS
+    Returns the ARC19 client and the (metadata_hash, reserve_address, url) of every uploaded summary
+    '''
+    loop = asyncio.get_running_loop()
+    paper_queue = asyncio.Queue()
+    upload_queue = asyncio.Queue()
+
+    # One ARC19 client for the whole run: the algod clients and suggested params are reused
+    arc_obj = ARC19()
+
+    def fetch():
+        # arxiv/requests/PyMuPDF are blocking, so the fetch stage runs in a worker thread
+        try:
+            for paper_section in iter_fetched_papers(query=research_about , max_results=max_results):
+                loop.call_soon_threadsafe(paper_queue.put_nowait , paper_section.strip())
+        except Exception as e:
+            print(f"Error fetching papers: {e}")
+        finally:
+            for _ in range(MAX_CONCURRENT_SUMMARIES):
+                loop.call_soon_threadsafe(paper_queue.put_nowait , None)
+
+    async def summarize():
+        while (paper_content := await paper_queue.get()) is not None:
+            try:
+                paper_title , summary = await aprocess_paper(paper_content)
+                print(f"\n{'*'*50}")
+                print(f"Paper: {paper_title}")
+                print(f"{'*'*50}")
+                print(summary)
+                print(f"{'*'*50}\n")
+
+                # reportlab is blocking, so build the PDF off the event loop
+                pdf_filename , pdf_bytes = await loop.run_in_executor(None , render_pdf , summary , paper_title)
+            except Exception as e:
+                # One bad paper shouldn't stop the rest of the pipeline
+                print(f"Error summarizing paper: {e}")
+                continue
+            await upload_queue.put((pdf_filename , pdf_bytes))
+
+    async def upload():
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+        async def upload_one(session , filename , pdf_bytes):
+            async with semaphore:
+                # CID is basically the IPFS file hash
+                cid = await arc_obj.aupload_metadata_bytes(session , filename , pdf_bytes)
+
+            if not cid:
+                print("CID is empty :( ")
+                return None
             metadata_hash = arc_obj.create_metadata(
-                asset_name=name,
-                description=desc,
+                asset_name=filename,
+                description="Research paper",
                 ipfs_hash=cid
             )
-
             reserve_address = arc_obj.reserve_address_from_cid(cid=cid)
-
             url = arc_obj.create_url_from_cid(cid=cid)
+            return metadata_hash , reserve_address , url
+
+        # Pin each PDF as soon as it's rendered, without waiting on earlier uploads
+        uploads = []
+        async with aiohttp.ClientSession() as session:
+            while (item := await upload_queue.get()) is not None:
+                uploads.append(asyncio.create_task(upload_one(session , *item)))
+            assets = await asyncio.gather(*uploads , return_exceptions=True)
+        for asset in assets:
+            if isinstance(asset , Exception):
+                print(f"Error uploading summary: {asset}")
+        return [asset for asset in assets if asset is not None and not isinstance(asset , Exception)]
+
+    uploader = asyncio.create_task(upload())
+    summarizers = [asyncio.create_task(summarize()) for _ in range(MAX_CONCURRENT_SUMMARIES)]
+    try:
+        await asyncio.to_thread(fetch)
+        await asyncio.gather(*summarizers)
+    finally:
+        # Always release the uploader, so PDFs already queued still get pinned
+        await upload_queue.put(None)
+        assets = await uploader
+    return arc_obj , assets
 
-            transaction_id = arc_obj.create_asset(
-                metadata_hash=metadata_hash,
-                reserve_address=reserve_address,
-                url=url
-            )
 
+if __name__ == "__main__":
 
-            print("Transaction :\n https://lora.algokit.io/localnet/transaction/{}".format(transaction_id))
+    research_about = "Latest blockchain research"
 
-            
-            # Remove the directory after pdf's are minted and uploaded to IPFS as ARC19
-            
-        else:
-            print("CID is empty :( ")
+    arc_obj , assets = asyncio.run(run_pipeline(research_about , max_results=1))
 
-    shutil.rmtree(pdf_summary_directory)
\ No newline at end of file
+    # Sign and submit every asset together, then wait for their confirmations
+    for transaction_id in arc_obj.create_assets(assets):
+        print("Transaction :\n https://lora.algokit.io/localnet/transaction/{}".format(transaction_id))